@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+과거 기사 수집(backfill)
+날짜 범위의 소스별 아카이브 목록 페이지를 동시에 여러 개(작업 수 제한) 수집하여
+상위 8개만 남기는 news.json 대신 SQLite 기사 저장소에 모두 저장합니다.
+아카이브 목록은 기사 링크가 없는 페이지가 나올 때까지 페이지를 넘기며 읽고 (실행당 날짜·목록별 최대 --max-pages 페이지),
+제한에 걸리면 다음 페이지를 기록해 두었다가 다음 실행에서 그 페이지부터 이어서 읽습니다.
+(소스, 날짜) 작업의 모든 목록·기사 페이지를 받으면 완료를 기록하므로 중단해도 다시 실행하면 남은 날짜부터 이어서 수집하고,
+일부 페이지가 실패한 날짜는 다음 실행에서 다시 수집합니다. 이미 저장된 기사는 상세 페이지를 다시 요청하지 않습니다.
+상세 페이지가 --max-attempts번 실패한 기사는 실패로 기록하고 더 요청하지 않으므로 그 날짜의 완료를 막지 않습니다.
+
+사용법:
+    python scripts/backfill.py --start 2024-07-01 [--end 2024-09-30] [--sources hankyung naver]
+                               [--jobs 4] [--rps 2] [--max-pages 10] [--max-attempts 3]
+                               [--db data/news_archive.db] [--restart]
+"""
+
+import argparse
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from crawl_engine import BASE_DIR, CrawlEngine
+from seen_store import SeenArticleStore
+from source_adapters import HankyungEconomyAdapter, NaverAdapter
+
+DEFAULT_DB = os.path.join(BASE_DIR, 'data', 'news_archive.db')
+
+# 날짜별 아카이브 페이지가 있는 소스 (제목 키워드 제한 없이 섹션 기사를 모두 저장)
+BACKFILL_SOURCES = {
+    'hankyung': lambda: HankyungEconomyAdapter(economy_keywords=()),
+    'naver': lambda: NaverAdapter(title_keyword=None, max_candidates=None, keep_failed=False),
+}
+
+
+def date_range(start, end):
+    """start부터 end까지의 날짜 (최신 날짜부터)"""
+    day = end
+    while day >= start:
+        yield day
+        day -= timedelta(days=1)
+
+
+def parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+class Backfill:
+    def __init__(self, store, sources, jobs=4, requests_per_second=2.0, per_host_concurrency=4, use_cache=False,
+                 max_pages=10, max_attempts=3):
+        self.store = store
+        self.adapters = {key: BACKFILL_SOURCES[key]() for key in sources}
+        # 동시에 처리할 (소스, 날짜) 작업 수
+        self.jobs = jobs
+        # 아카이브 목록 하나에서 읽을 최대 페이지 수
+        self.max_pages = max_pages
+        # 기사 하나의 상세 수집을 포기하기까지의 실행 간 누적 시도 횟수
+        self.max_attempts = max_attempts
+        self.engine = CrawlEngine(
+            requests_per_second=requests_per_second,
+            use_cache=use_cache,
+            max_workers=max(jobs, per_host_concurrency),
+            per_host_concurrency=per_host_concurrency
+        )
+        # 기사 저장소를 증분 저장소로 사용: 저장된 기사는 재요청하지 않고, 새로 수집한 기사는 바로 저장
+        self.engine.seen_store = store
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.articles = 0
+
+    def run_job(self, key, target_date):
+        """(소스, 날짜) 작업 하나 수집 후 완료 기록
+
+        모든 목록 페이지를 끝까지 받고 모든 후보 기사를 수집(또는 저장소에서 재사용, 시도 횟수 초과로 포기)했을 때만
+        완료로 기록합니다. 실패한 페이지가 있거나 페이지 수 제한에 걸리면 None을 반환하고,
+        다음 실행에서 아직 끝나지 않은 첫 페이지부터 이어서 읽으며 저장되지 않은 기사만 다시 요청합니다.
+        """
+        adapter = self.adapters[key]
+        job = f"{key}:{target_date.isoformat()}"
+        max_pages = self.max_pages if adapter.archive_page_param else 1
+        given_up = self.store.given_up(job, self.max_attempts)
+        # 받지 못한 목록 페이지와 기사 URL
+        failures = []
+        incomplete = False
+        count = 0
+        for url in adapter.archive_urls(target_date):
+            first_page = self.store.next_page(job, url)
+            # 이 페이지 앞까지는 목록과 기사를 모두 처리함 (다음 실행에서 이어서 읽을 페이지)
+            resume_page = first_page
+            for page in range(first_page, first_page + max_pages):
+                page_url = adapter.archive_page_url(url, page)
+                try:
+                    links = self.engine.fetch_listing(adapter, page_url, timeout=15)
+                except Exception as e:
+                    print(f"Error crawling {page_url}: {e}")
+                    failures.append(page_url)
+                    break
+                # 기사 링크가 없으면 마지막 페이지를 지난 것 (다른 페이지·날짜에서 본 기사만 있는 페이지는 계속 넘김)
+                if not self.engine.select_links(adapter, links, page_url):
+                    break
+                candidates = [
+                    (full_url, title) for full_url, title in self.engine.select_candidates(adapter, links, page_url)
+                    if full_url not in given_up
+                ]
+                page_failures = []
+                count += len(self.engine.fetch_articles(adapter, candidates, failed=page_failures))
+                retry_later = []
+                for article_url in page_failures:
+                    if self.store.record_failure(job, article_url) >= self.max_attempts:
+                        print(f"Giving up on {article_url} after {self.max_attempts} failed attempts")
+                    else:
+                        retry_later.append(article_url)
+                failures.extend(retry_later)
+                if resume_page == page and not retry_later:
+                    resume_page = page + 1
+            else:
+                if adapter.archive_page_param:
+                    print(f"Reached {max_pages} pages for {url}; continuing from page {resume_page} on the next run")
+                    incomplete = True
+
+            if resume_page > first_page:
+                self.store.save_next_page(job, url, resume_page)
+
+        if failures:
+            print(f"{key} {target_date}: {len(failures)} pages failed")
+            return None
+        if incomplete:
+            return None
+
+        self.store.mark_done(job, count)
+        return count
+
+    def run(self, start, end, restart=False):
+        """날짜 범위 수집 (완료된 작업은 건너뜀)"""
+        if restart:
+            for key in self.adapters:
+                self.store.clear_checkpoints(f"{key}:")
+
+        done = set()
+        for key in self.adapters:
+            done |= self.store.done_jobs(f"{key}:")
+        pending = [
+            (key, day)
+            for day in date_range(start, end)
+            for key, adapter in self.adapters.items()
+            if adapter.archive_url_templates and f"{key}:{day.isoformat()}" not in done
+        ]
+        total = len(pending)
+        print(f"Backfill {start} ~ {end}: {total} jobs pending, {len(done)} already done")
+
+        self.engine.start_run()
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            futures = {executor.submit(self.run_job, key, day): (key, day) for key, day in pending}
+            for future in as_completed(futures):
+                key, day = futures[future]
+                try:
+                    count = future.result()
+                except Exception as e:
+                    print(f"Error in backfill job {key} {day}: {e}")
+                    count = None
+                with self._lock:
+                    if count is None:
+                        self.failed += 1
+                    else:
+                        self.completed += 1
+                        self.articles += count
+                    progress = self.completed + self.failed
+                status = 'incomplete (will resume on next run)' if count is None else f"{count} articles"
+                print(f"[{progress}/{total}] {key} {day}: {status}")
+        except KeyboardInterrupt:
+            print("Interrupted; completed dates are checkpointed and will be skipped on the next run")
+            raise
+        finally:
+            # 중단 시 대기 중인 작업은 취소하고 진행 중인 작업만 마무리
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.engine.close()
+
+        print(f"Backfill finished: {self.completed} jobs done, {self.failed} failed, "
+              f"{self.articles} articles, {self.store.count()} articles in store")
+        self.engine.report()
+        return self.failed == 0
+
+
+def main():
+    yesterday = (datetime.now() - timedelta(days=1)).date()
+    parser = argparse.ArgumentParser(description='Backfill archived news for a date range into a SQLite store')
+    parser.add_argument('--start', type=parse_date, required=True, help='first date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=parse_date, default=yesterday, help='last date (default: yesterday)')
+    parser.add_argument('--sources', nargs='*', default=list(BACKFILL_SOURCES),
+                        help=f"sources to backfill: {', '.join(BACKFILL_SOURCES)} (default: all)")
+    parser.add_argument('--jobs', type=int, default=4, help='(source, date) jobs crawled concurrently')
+    parser.add_argument('--per-host', type=int, default=4, help='concurrent requests per host')
+    parser.add_argument('--rps', type=float, default=2.0, help='requests per second per host')
+    parser.add_argument('--max-pages', type=int, default=10, help='archive listing pages read per source and date')
+    parser.add_argument('--max-attempts', type=int, default=3,
+                        help='failed attempts (across runs) before an article is skipped')
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite article store')
+    parser.add_argument('--restart', action='store_true', help='ignore checkpoints and crawl every date again')
+    args = parser.parse_args()
+    unknown = [key for key in args.sources if key not in BACKFILL_SOURCES]
+    if unknown:
+        parser.error(f"unknown source: {', '.join(unknown)}")
+    if args.start > args.end:
+        parser.error('--start must not be after --end')
+
+    store = SeenArticleStore(args.db)
+    try:
+        backfill = Backfill(store, args.sources, jobs=args.jobs, requests_per_second=args.rps,
+                            per_host_concurrency=args.per_host, max_pages=args.max_pages,
+                            max_attempts=args.max_attempts)
+        ok = backfill.run(args.start, args.end, restart=args.restart)
+    finally:
+        store.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+크롤러 처리량 벤치마크
+가상 뉴스 사이트 서버(fixture_server)를 별도 프로세스로 띄우고 실제 사이트 대신 그 서버로 요청을 보내
+EnhancedHankyungCrawler, ImprovedNewsCrawler, NewsCrawler의 초당 기사 수, 기사당 바이트,
+CPU 시간, 최대 메모리를 측정합니다. 섹션을 늘리기 전에 크롤링 작업 규모를 가늠하는 데 사용합니다.
+CPU 시간과 메모리가 섞이지 않도록 크롤러마다 새 프로세스에서 실행합니다.
+
+사용법:
+    python scripts/benchmark_crawl.py [enhanced improved news] [--articles 60] [--latency 0.05]
+                                      [--error-rate 0.0] [--rps 0]
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import requests
+
+from fixture_server import SITES
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 이름: (모듈, 클래스, 크롤링 메서드)
+CRAWLERS = {
+    'enhanced': ('enhanced_hankyung_crawler', 'EnhancedHankyungCrawler', 'crawl_hankyung_news'),
+    'improved': ('improved_crawler', 'ImprovedNewsCrawler', 'crawl_all_news'),
+    'news': ('crawler', 'NewsCrawler', 'crawl_all_news'),
+}
+
+
+def start_server(args):
+    """가상 뉴스 서버 프로세스를 시작하고 응답할 때까지 대기"""
+    command = [
+        sys.executable, os.path.join(SCRIPTS_DIR, 'fixture_server.py'),
+        '--port', str(args.port), '--articles', str(args.articles), '--paragraphs', str(args.paragraphs),
+        '--filler', str(args.filler), '--latency', str(args.latency), '--jitter', str(args.jitter),
+        '--error-rate', str(args.error_rate)
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    server_url = f"http://127.0.0.1:{args.port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{server_url}/__stats__", timeout=1)
+            return process, server_url
+        except requests.RequestException:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"Fixture server did not start on {server_url}")
+
+
+def run_crawler(name, server_url, rps, results):
+    """(자식 프로세스) 크롤러 하나를 가상 서버에 대해 실행하고 측정값을 results 큐에 넣음"""
+    module_name, class_name, method = CRAWLERS[name]
+    module = __import__(module_name)
+    # 캐시 없이 매번 서버에서 받아야 처리량을 잴 수 있음 (rps 0이면 속도 제한 없음)
+    crawler = getattr(module, class_name)(requests_per_second=rps, use_cache=False)
+    crawler.engine.session.host_overrides = {host: server_url for host in SITES}
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    news = getattr(crawler, method)()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    crawler.engine.close()
+
+    # 리눅스에서 ru_maxrss 단위는 KB
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put({'returned': len(news), 'elapsed': elapsed, 'cpu': cpu, 'peak_mb': peak_kb / 1024})
+
+
+def benchmark(name, server_url, rps):
+    """크롤러를 새 프로세스에서 실행하고 서버 통계와 합쳐 결과 반환"""
+    requests.get(f"{server_url}/__reset__", timeout=5)
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=run_crawler, args=(name, server_url, rps, results))
+    process.start()
+    result = results.get()
+    process.join()
+
+    stats = requests.get(f"{server_url}/__stats__", timeout=5).json()
+    articles = stats['article_pages']
+    result.update({
+        'crawler': name,
+        'articles': articles,
+        'listings': stats['listing_pages'],
+        'errors': stats['errors'],
+        'articles_per_sec': articles / result['elapsed'] if result['elapsed'] else 0.0,
+        'bytes_per_article': stats['bytes_sent'] / articles if articles else 0.0
+    })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawler throughput benchmark against a local fixture server')
+    parser.add_argument('crawlers', nargs='*', help=f"crawlers to run: {', '.join(CRAWLERS)} (default: all)")
+    parser.add_argument('--port', type=int, default=8800, help='fixture server port')
+    parser.add_argument('--articles', type=int, default=60, help='article links per section page')
+    parser.add_argument('--paragraphs', type=int, default=12, help='paragraphs per article')
+    parser.add_argument('--filler', type=int, default=30, help='ad/widget blocks per page (page size)')
+    parser.add_argument('--latency', type=float, default=0.0, help='server delay per response in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random +/- seconds added to latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--rps', type=float, default=0, help='requests per second per domain (0: unlimited)')
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"unknown crawler: {', '.join(unknown)}")
+
+    server, server_url = start_server(args)
+    results = []
+    try:
+        for name in args.crawlers or list(CRAWLERS):
+            print(f"=== {name} ===")
+            results.append(benchmark(name, server_url, args.rps))
+    finally:
+        server.terminate()
+        server.wait()
+
+    header = (f"{'crawler':<10} {'fetched':>8} {'returned':>8} {'errors':>7} {'time':>8} "
+              f"{'art/s':>8} {'KB/art':>8} {'CPU':>7} {'peak MB':>8}")
+    print()
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['crawler']:<10} {r['articles']:>8} {r['returned']:>8} {r['errors']:>7} {r['elapsed']:>7.2f}s "
+              f"{r['articles_per_sec']:>8.1f} {r['bytes_per_article'] / 1024:>8.1f} {r['cpu']:>6.2f}s "
+              f"{r['peak_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 벤치마크
+저장된 페이지(또는 가상 페이지)를 백엔드별로 파싱하고, 크롤러가 실제로 하는
+링크/본문 선택까지 포함한 페이지당 처리 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmark_parsers.py [페이지.html ...] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from fixture_pages import make_article_page, make_section_page
+from html_parser import available_backends, parse_html
+
+LINK_SELECTOR = 'a[href*="/article/"]'
+CONTENT_SELECTORS = ['.article-body', '.news-body', '.article_view', '.article-content']
+
+
+def workload(content, backend):
+    """크롤러와 같은 작업: 파싱 → 기사 링크 수집 → 본문 선택"""
+    soup = parse_html(content, backend)
+    links = [link.get('href') for link in soup.select(LINK_SELECTOR)]
+    for selector in CONTENT_SELECTORS:
+        elem = soup.select_one(selector)
+        if elem:
+            elem.get_text(strip=True)
+            break
+    return len(links)
+
+
+def load_pages(paths):
+    """벤치마크할 페이지 로드 (경로가 없으면 가상 페이지 사용)"""
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(('.html', '.htm')):
+                    pages.append(os.path.join(path, name))
+        else:
+            pages.append(path)
+
+    if not pages:
+        return [
+            ('fixture:section', make_section_page().encode('utf-8')),
+            ('fixture:article', make_article_page().encode('utf-8')),
+        ]
+
+    loaded = []
+    for page in pages:
+        with open(page, 'rb') as f:
+            loaded.append((page, f.read()))
+    return loaded
+
+
+def benchmark(pages, backends, repeat):
+    """백엔드별 페이지당 평균 처리 시간(ms) 측정"""
+    results = {}
+    for name, content in pages:
+        results[name] = {}
+        for backend in backends:
+            workload(content, backend)  # 워밍업
+            start = time.perf_counter()
+            for _ in range(repeat):
+                workload(content, backend)
+            results[name][backend] = (time.perf_counter() - start) / repeat * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML parser backend benchmark')
+    parser.add_argument('pages', nargs='*', help='HTML files or directories of saved pages')
+    parser.add_argument('--repeat', type=int, default=20, help='parses per page and backend')
+    args = parser.parse_args()
+
+    backends = available_backends()
+    pages = load_pages(args.pages)
+    results = benchmark(pages, backends, args.repeat)
+
+    print(f"Backends: {', '.join(backends)} (default: {backends[0]})")
+    header = f"{'page':<40} {'KB':>7} " + ' '.join(f"{backend:>12}" for backend in backends)
+    print(header)
+    print('-' * len(header))
+    for name, content in pages:
+        timings = ' '.join(f"{results[name][backend]:>10.2f}ms" for backend in backends)
+        print(f"{os.path.basename(name)[:40]:<40} {len(content) / 1024:>7.1f} {timings}")
+
+    totals = {backend: sum(results[name][backend] for name, _ in pages) / len(pages) for backend in backends}
+    print('-' * len(header))
+    print(f"{'average':<40} {'':>7} " + ' '.join(f"{totals[backend]:>10.2f}ms" for backend in backends))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+녹화된 HTTP 아카이브 재생 벤치마크
+CRAWL_ARCHIVE=record 로 녹화한 아카이브를 네트워크 없이 재생하여
+목록 링크 추출·기사 파싱 처리량과 (지연 시간을 흉내 낸) 전체 크롤링 시간을 측정합니다.
+
+사용법:
+    CRAWL_ARCHIVE=record python scripts/enhanced_hankyung_crawler.py
+    python scripts/benchmark_replay.py [아카이브.warc] [--latency 0.05] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from crawl_engine import BASE_DIR
+from enhanced_hankyung_crawler import EnhancedHankyungCrawler
+from http_archive import HTTPArchive
+
+DEFAULT_ARCHIVE = os.path.join(BASE_DIR, '.cache', 'archive', 'crawl.warc')
+
+
+def split_urls(archive, adapter):
+    """아카이브 URL을 기사 페이지와 목록 페이지로 분류"""
+    articles = [url for url in archive.urls() if adapter.accept_link(url)]
+    listings = [url for url in archive.urls() if not adapter.accept_link(url)]
+    return listings, articles
+
+
+def measure(func, items, repeat):
+    """항목당 평균 처리 시간(ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / (repeat * len(items)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded crawl archive offline')
+    parser.add_argument('archive', nargs='?', default=DEFAULT_ARCHIVE, help='WARC archive recorded with CRAWL_ARCHIVE=record')
+    parser.add_argument('--latency', type=float, default=0.0, help='simulated seconds per response in the end-to-end run')
+    parser.add_argument('--repeat', type=int, default=5, help='passes over the archive for the parse benchmarks')
+    parser.add_argument('--parser', default=None, help='HTML parser backend (default: fastest available)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.archive):
+        print(f"Archive not found: {args.archive}")
+        return 1
+
+    archive = HTTPArchive(args.archive, 'replay')
+    crawler = EnhancedHankyungCrawler(use_cache=False, parser_backend=args.parser, archive=archive)
+    engine, adapter = crawler.engine, crawler.adapter
+    listings, articles = split_urls(archive, adapter)
+    print(f"Archive: {len(archive)} responses ({len(listings)} listing pages, {len(articles)} articles)")
+
+    bodies = {url: archive.replay(url).content for url in archive.urls()}
+    archive.replayed = 0
+    total_bytes = sum(len(body) for body in bodies.values())
+    print(f"Body size: {total_bytes / 1024:.1f} KB total, "
+          f"{total_bytes / 1024 / max(len(bodies), 1):.1f} KB per page")
+
+    if listings:
+        ms = measure(lambda url: engine.extract_links(adapter, bodies[url]), listings, args.repeat)
+        print(f"Listing link extraction: {ms:.2f} ms/page ({1000 / ms:.0f} pages/s)")
+    if articles:
+        ms = measure(lambda url: adapter.parse_detail(bodies[url], url, '', engine.parser_backend, engine.selector_cache), articles, args.repeat)
+        print(f"Article parsing:         {ms:.2f} ms/page ({1000 / ms:.0f} pages/s)")
+
+    # 전체 크롤링: 녹화된 목록 페이지에서 시작해 링크 선택 → 상세 수집 → 파싱 → 중복 제거까지
+    archive.latency = args.latency
+    engine.start_run()
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    news = engine.fetch_articles(adapter, [
+        candidate for url in listings for candidate in engine.collect_candidates(adapter, url)
+    ])
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    engine.close()
+    print(f"End-to-end replay (latency {args.latency * 1000:.0f} ms): {len(news)} articles in {elapsed:.2f}s "
+          f"({len(news) / elapsed if elapsed else 0:.1f} articles/s, CPU {cpu:.2f}s)")
+    engine.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
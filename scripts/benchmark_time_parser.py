@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+발행시간 파서 마이크로벤치마크
+기존 방식(strptime 패턴을 차례로 시도하며 예외로 실패 처리)과
+정규식 분기 파서(time_parser.parse_time)의 호출당 시간을 입력 형식별로 비교합니다.
+
+사용법:
+    python scripts/benchmark_time_parser.py [--repeat 20000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+from time_parser import parse_time
+
+# 기사 페이지의 시간 요소에서 실제로 보이는 형식
+SAMPLES = [
+    '2024-10-18T09:30:00+09:00',
+    '2024.10.18 09:30',
+    '2024-10-18',
+    '10.18 09:30',
+    '3시간 전',
+    '오후 2:10',
+    '입력 2024.10.18 오후 2:10',
+    '한국경제신문',
+]
+
+
+def legacy_parse_time(time_str):
+    """기존 크롤러의 시간 파싱 (비교 기준)"""
+    try:
+        time_str = time_str.strip()
+
+        if 'T' in time_str:
+            return datetime.fromisoformat(time_str.replace('Z', '+00:00')).isoformat()
+
+        for pattern in ['%Y-%m-%d %H:%M', '%Y.%m.%d %H:%M', '%Y-%m-%d', '%Y.%m.%d', '%m-%d %H:%M', '%m.%d %H:%M']:
+            try:
+                parsed_time = datetime.strptime(time_str, pattern)
+                if parsed_time.year == 1900:
+                    parsed_time = parsed_time.replace(year=datetime.now().year)
+                return parsed_time.isoformat()
+            except ValueError:
+                continue
+
+        now = datetime.now()
+        for unit, delta in (('분', 'minutes'), ('시간', 'hours'), ('일', 'days')):
+            match = re.search(rf'(\d+)\s*{unit}\s*전', time_str)
+            if match:
+                return (now - timedelta(**{delta: int(match.group(1))})).isoformat()
+        return None
+
+    except Exception:
+        return None
+
+
+def measure(func, value, repeat):
+    """호출당 평균 시간(마이크로초)"""
+    func(value)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(value)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish-time parser micro-benchmark')
+    parser.add_argument('--repeat', type=int, default=20000, help='calls per input and parser')
+    args = parser.parse_args()
+
+    header = f"{'input':<28} {'legacy':>10} {'regex':>10} {'speedup':>8}  result"
+    print(header)
+    print('-' * len(header))
+    totals = [0.0, 0.0]
+    for sample in SAMPLES:
+        legacy = measure(legacy_parse_time, sample, args.repeat)
+        fast = measure(parse_time, sample, args.repeat)
+        totals[0] += legacy
+        totals[1] += fast
+        print(f"{sample:<28} {legacy:>8.2f}us {fast:>8.2f}us {legacy / fast:>7.1f}x  {parse_time(sample)}")
+    print('-' * len(header))
+    legacy, fast = (total / len(SAMPLES) for total in totals)
+    print(f"{'average':<28} {legacy:>8.2f}us {fast:>8.2f}us {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
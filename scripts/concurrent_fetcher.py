@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+동시 상세 페이지 수집기
+호스트별 동시 요청 수를 제한하면서 여러 기사를 병렬로 가져옵니다.
+요청 간격(초당 요청 수)은 세션의 도메인별 속도 제한기(rate_limiter)가 담당합니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+
+class ConcurrentFetcher:
+    def __init__(self, max_workers=8, per_host_concurrency=4):
+        self.max_workers = max_workers
+        self.per_host_concurrency = per_host_concurrency
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _host_semaphore(self, host):
+        """호스트별 동시 요청 세마포어 반환"""
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host_concurrency)
+            return self._semaphores[host]
+
+    def _run(self, fetch_func, url, args):
+        """호스트 제한을 지키며 단일 작업 실행"""
+        host = urlparse(url).netloc
+        with self._host_semaphore(host):
+            return fetch_func(url, *args)
+
+    def fetch_all(self, fetch_func, jobs):
+        """(url, *args) 작업 목록을 병렬로 실행하고 입력 순서대로 결과 반환
+
+        실패한 작업의 결과는 None으로 채워집니다.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+
+        results = [None] * len(jobs)
+        workers = min(self.max_workers, len(jobs))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._run, fetch_func, job[0], job[1:]): index
+                for index, job in enumerate(jobs)
+            }
+            for future, index in futures.items():
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"Error fetching {jobs[index][0]}: {e}")
+
+        return results
@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+"""
+통합 크롤링 엔진
+뉴스 사이트별 차이(목록 URL, 링크 선택자, 본문 선택자, 시간 파서)는 소스 어댑터에 두고,
+수집·중복 제거·속도 제한·캐시·병렬 처리 같은 공통 로직은 이 엔진 한 곳에서 처리합니다.
+"""
+
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from urllib.parse import urljoin
+
+from concurrent_fetcher import ConcurrentFetcher
+from crawl_metrics import CrawlMetrics
+from crawl_pipeline import CrawlPipeline
+from feed_reader import FeedReader
+from frontier import CrawlFrontier, canonicalize_url
+from html_parser import parse_html
+from http_client import create_session
+from http_cache import HTTPCache
+from link_extractor import extract_links
+from near_duplicates import NearDuplicateDetector
+from rate_limiter import HostRateLimiter
+from retry_policy import CircuitBreaker, RetryPolicy
+from seen_store import SeenArticleStore
+from selector_cache import SelectorCache
+from sitemap_discovery import SitemapDiscovery
+from streaming_extractor import fetch_article_stream
+from text_density import extract_main_text
+from time_parser import now_iso, parse_time
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def newest_first(article):
+    """최신순 정렬 키 (발행시간이 같으면 URL로 순서를 고정해 수집 순서와 무관한 결과)"""
+    return article.get('publishedAt', ''), article.get('url', '')
+
+
+class SourceAdapter:
+    """뉴스 소스 어댑터 기본 클래스
+
+    하위 클래스는 클래스 속성으로 사이트별 설정을 정의하고,
+    생성자 키워드 인자로 크롤러마다 다른 값(본문 길이, 기사 수 등)을 덮어쓸 수 있습니다.
+    """
+    key = ''
+    name = ''
+    category = '경제'
+    listing_urls = []
+    # 날짜별 아카이브 목록 페이지 URL 형식 ({date}: yyyymmdd)
+    archive_url_templates = []
+    # 아카이브 목록의 페이지 번호 쿼리 매개변수 (None이면 첫 페이지만 사용)
+    archive_page_param = None
+    # 사이트맵 탐색: robots.txt를 읽을 사이트 주소와, robots.txt에 사이트맵이 없을 때 사용할 사이트맵
+    site_url = None
+    news_sitemaps = []
+    # RSS/Atom 피드 URL (피드 설명이 이 글자 수보다 짧으면 기사 페이지에서 본문 수집)
+    feed_urls = []
+    min_feed_summary = 20
+    # 목록 페이지에서 기사 링크로 인정할 href 부분 문자열
+    link_patterns = ('/article/',)
+    # link_mode == 'full' 일 때 사용할 선택자
+    link_selectors = ['a[href]']
+    link_mode = 'regex'
+    links_per_selector = 15
+    max_links = 60
+    content_selectors = []
+    time_selectors = []
+    # 시간 요소의 속성값을 텍스트보다 먼저 확인 (예: <time datetime="...">)
+    time_attribute = None
+    content_limit = 1000
+    min_title_length = 10
+    # 상세 요청 전 후보 수 제한 (None이면 모두 요청)
+    max_candidates = None
+    # 소스별 최종 기사 수
+    max_articles = 10
+    # 상세 요청이 실패해도 제목만으로 기사를 남길지 여부
+    keep_failed = False
+    # 기사 URL에서 최신순 정렬 키를 뽑는 정규식 (숫자 그룹들을 앞에서부터 비교, None이면 순위 없음)
+    article_id_pattern = None
+    # 기사 번호의 첫 그룹이 발행일(yyyymmdd)인지 여부 (발행시간 상한 추정에 사용)
+    article_id_has_date = False
+
+    def __init__(self, **overrides):
+        for name, value in overrides.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"{type(self).__name__} has no setting '{name}'")
+            setattr(self, name, value)
+
+    def archive_urls(self, target_date):
+        """특정 날짜의 아카이브 목록 페이지 URL"""
+        date_str = target_date.strftime('%Y%m%d')
+        return [template.format(date=date_str) for template in self.archive_url_templates]
+
+    def archive_page_url(self, url, page):
+        """아카이브 목록 URL의 page번째 페이지 URL (첫 페이지는 원래 URL)"""
+        if page <= 1 or not self.archive_page_param:
+            return url
+        separator = '&' if '?' in url else '?'
+        return f"{url}{separator}{self.archive_page_param}={page}"
+
+    def accept_link(self, href):
+        """기사 링크 여부"""
+        return bool(href) and any(pattern in href for pattern in self.link_patterns)
+
+    def accept_title(self, title):
+        """수집할 제목인지 여부"""
+        return bool(title) and len(title) > self.min_title_length
+
+    def listing_rank(self, url):
+        """상세 페이지를 받지 않고 URL만으로 구한 최신순 정렬 키 (클수록 최신, 알 수 없으면 None)"""
+        if self.article_id_pattern is None:
+            return None
+        match = re.search(self.article_id_pattern, url)
+        if not match:
+            return None
+        return tuple(int(group) for group in match.groups())
+
+    def listing_time_bound(self, url):
+        """URL만으로 알 수 있는 발행시간 상한 (기사 번호의 발행일 마지막 시각, 알 수 없으면 None)"""
+        rank = self.listing_rank(url) if self.article_id_has_date else None
+        if not rank:
+            return None
+        day = str(rank[0])
+        return f"{day[:4]}-{day[4:6]}-{day[6:8]}T23:59:59.999999+09:00"
+
+    def parse_time(self, time_str):
+        """발행시간 파싱 (KST ISO 문자열 또는 None)"""
+        return parse_time(time_str)
+
+    def build_article(self, title, content, url, published_at):
+        """기사 데이터 구성"""
+        return {
+            'title': title,
+            'content': (content or title)[:self.content_limit],  # 본문이 없으면 제목 사용
+            'url': url,
+            'source': self.name,
+            'publishedAt': published_at or now_iso(),
+            'category': self.category
+        }
+
+    def parse_detail(self, html, url, title, parser_backend=None, selector_cache=None):
+        """기사 HTML에서 본문과 발행시간 추출
+
+        selector_cache가 있으면 같은 도메인·페이지 형식에서 성공했던 선택자를 먼저 시도하고 결과를 학습합니다.
+        본문 선택자가 하나도 맞지 않으면 텍스트 밀도로 본문 영역을 찾습니다.
+        """
+        soup = parse_html(html, parser_backend)
+        content_selectors = self.content_selectors
+        time_selectors = self.time_selectors
+        if selector_cache:
+            content_selectors = selector_cache.ordered(url, 'content', content_selectors)
+            time_selectors = selector_cache.ordered(url, 'time', time_selectors)
+
+        content = ""
+        for selector in content_selectors:
+            content_elem = soup.select_one(selector)
+            if content_elem:
+                content = content_elem.get_text(strip=True)
+                if selector_cache:
+                    selector_cache.learn(url, 'content', selector)
+                break
+        else:
+            content = extract_main_text(soup)
+            if selector_cache and content:
+                selector_cache.record_fallback()
+
+        published_at = None
+        for selector in time_selectors:
+            time_elem = soup.select_one(selector)
+            if time_elem:
+                time_text = (self.time_attribute and time_elem.get(self.time_attribute)) or time_elem.get_text(strip=True)
+                published_at = self.parse_time(time_text)
+                if published_at:
+                    if selector_cache:
+                        selector_cache.learn(url, 'time', selector)
+                    break
+
+        return self.build_article(title, content, url, published_at)
+
+
+def parse_article(html, url, title, adapter, parser_backend=None, selector_cache=None):
+    """파이프라인 프로세스 풀에서 호출하는 기사 파싱 함수
+
+    selector_cache는 메인 프로세스의 학습 결과 사본으로, 여기서 학습한 내용은 저장되지 않습니다.
+    """
+    return adapter.parse_detail(html, url, title, parser_backend, selector_cache)
+
+
+class CrawlEngine:
+    def __init__(self, requests_per_second=1.0, headers=None, use_cache=True, incremental=False,
+                 parser_backend=None, max_workers=8, per_host_concurrency=4,
+                 streaming=False, stream_max_bytes=256 * 1024, pipeline=False, source_timeout=60,
+                 near_duplicates=True, max_retries=2, breaker_threshold=3, breaker_cooldown=60,
+                 connect_timeout=5.0, read_timeout=15.0, http2=False, archive=None, sitemaps=False,
+                 feeds=False, base_dir=BASE_DIR):
+        self.base_dir = base_dir
+        # 소스별 제한 시간(초): 병렬 수집에서 이 시간 안에 끝나지 않은 소스는 결과에서 제외
+        self.source_timeout = source_timeout
+        self._lock = threading.Lock()
+        # 실행 지표: 호스트별 응답 시간·크기·상태 코드, 파싱 시간, 초당 기사 수
+        self.metrics = CrawlMetrics()
+        # 도메인별 토큰 버킷으로 요청 간격 조절 (사이트마다 독립적으로 적용)
+        # 일시적 오류는 백오프 재시도, 연속 실패한 호스트는 대기 시간 동안 요청 생략
+        # 호스트별 커넥션 풀은 동시 요청 수만큼 keep-alive 연결을 유지 (http2=True면 HTTPS는 HTTP/2)
+        self.session = create_session(
+            pool_maxsize=max(max_workers, per_host_concurrency),
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            http2=http2,
+            rate_limiter=HostRateLimiter(requests_per_second),
+            retry=RetryPolicy(max_retries=max_retries),
+            breaker=CircuitBreaker(failure_threshold=breaker_threshold, cooldown=breaker_cooldown),
+            # HTTPArchive: 응답 녹화(record) 또는 녹화된 응답으로 오프라인 재생(replay)
+            archive=archive,
+            metrics=self.metrics
+        )
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # SSL 검증 우회 (개발/테스트 환경에서만)
+        self.session.verify = False
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        if use_cache:
+            # 디스크 HTTP 캐시 (변경되지 않은 페이지는 조건부 GET 304로 재사용)
+            self.session.cache = HTTPCache(os.path.join(self.base_dir, '.cache', 'http'))
+
+        # HTML 파서 백엔드 (None이면 사용 가능한 가장 빠른 백엔드)
+        self.parser_backend = parser_backend
+        # 증분 모드: 이전 실행에서 수집한 기사는 상세 페이지를 다시 요청하지 않음
+        self.seen_store = None
+        if incremental:
+            self.seen_store = SeenArticleStore(os.path.join(self.base_dir, '.cache', 'seen_articles.db'))
+        # 스트리밍 모드: 본문 앞부분을 얻거나 바이트 상한에 도달하면 기사 다운로드 중단
+        self.streaming = streaming
+        self.stream_max_bytes = stream_max_bytes
+        # 상세 페이지 병렬 수집기 (호스트별 동시 요청 수 제한)
+        self.fetcher = ConcurrentFetcher(max_workers=max_workers, per_host_concurrency=per_host_concurrency)
+        # 파이프라인 모드: I/O 스레드가 수집하고 프로세스 풀이 파싱
+        self.pipeline = None
+        if pipeline:
+            self.pipeline = CrawlPipeline(self.session, parse_article, fetch_workers=max_workers,
+                                          timeout=self.session.timeout)
+        # 제목이 조금 다른 같은 기사(여러 매체의 통신 기사 등)도 중복으로 제거
+        self.near_duplicate_detector = NearDuplicateDetector() if near_duplicates else None
+        # 사이트맵 탐색: 목록 페이지 대신 뉴스 사이트맵에서 기사 URL·제목·발행시간을 얻음
+        self.discovery = SitemapDiscovery(self.session) if sitemaps else None
+        # 피드 수집: 피드의 제목·링크·발행시간·리드 문단으로 기사를 만들고 본문이 없을 때만 상세 요청
+        self.feed_reader = FeedReader(self.session) if feeds else None
+        # 도메인·페이지 형식별로 성공한 본문/시간 선택자를 기억 (캐시 사용 시 파일로 저장)
+        self.selector_cache = SelectorCache(
+            os.path.join(self.base_dir, '.cache', 'selectors.json') if use_cache else None
+        )
+
+        self.start_run()
+
+    def start_run(self):
+        """크롤링 실행 단위 상태 초기화 (URL 프론티어, 재사용 카운터)"""
+        self.frontier = CrawlFrontier()
+        self.reused_count = 0
+        # 실제로 상세 페이지를 요청한 기사 수
+        self.detail_fetches = 0
+        self.near_duplicates_removed = 0
+        # 조기 종료 수집에서 상세 요청한 후보 수 / 전체 후보 수
+        self.top_k_fetched = 0
+        self.top_k_candidates = 0
+        # 사이트맵·피드에서 얻은 기사별 발행시간 (정규화 URL → KST ISO 문자열)
+        self.discovered_times = {}
+        # 이번 실행에서 수집한 기사 (정규화 URL → 기사): 프론티어가 건너뛴 기사를 다시 요청하지 않고 찾아 씀
+        self.collected = {}
+        # 피드에 본문이 없어 상세 페이지를 요청한 기사 수
+        self.feed_fallbacks = 0
+        self.metrics.reset()
+        if self.pipeline:
+            self.pipeline.reset_stats()
+        if self.session.cache is not None:
+            self.session.cache.reset_stats()
+
+    def fetch_listing(self, adapter, url, timeout=None):
+        """목록 페이지를 받아 (href, 제목) 링크 목록 반환"""
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return self.extract_links(adapter, response.content)
+
+    def extract_links(self, adapter, content):
+        """목록 페이지 HTML에서 링크 추출 (추출 방식은 어댑터의 link_mode)"""
+        started = time.perf_counter()
+        if adapter.link_mode != 'full':
+            # 전체 DOM 없이 기사 링크만 추출
+            links = extract_links(content, adapter.link_patterns, mode=adapter.link_mode,
+                                  max_links=adapter.max_links)
+        else:
+            soup = parse_html(content, self.parser_backend)
+            links = []
+            for selector in adapter.link_selectors:
+                for link in soup.select(selector)[:adapter.links_per_selector]:
+                    links.append((link.get('href'), link.get_text(strip=True)))
+        self.metrics.record_parse('listing', time.perf_counter() - started)
+        return links
+
+    def select_links(self, adapter, links, base_url):
+        """링크 중 어댑터가 받아들이는 기사 (URL, 제목) 목록 (프론티어와 무관)"""
+        return [
+            (urljoin(base_url, href), title) for href, title in links
+            if adapter.accept_link(href) and adapter.accept_title(title)
+        ]
+
+    def select_candidates(self, adapter, links, base_url):
+        """링크 중 상세 요청할 (URL, 제목) 후보 선택 (프론티어로 중복 요청 제거)"""
+        # 중복은 정규화 URL로 판단하고 요청·저장은 원래 URL 사용 (정규화 URL은 사이트에 따라 404·리디렉트)
+        return [
+            (full_url, title) for full_url, title in self.select_links(adapter, links, base_url)
+            if self.frontier.add(full_url)
+        ]
+
+    def remember(self, article):
+        """이번 실행에서 수집한 기사 기록"""
+        with self._lock:
+            self.collected[canonicalize_url(article['url'])] = article
+
+    def collected_article(self, url):
+        """이번 실행에서 이미 수집한 기사 (없으면 None)"""
+        return self.collected.get(canonicalize_url(url))
+
+    def collect_candidates(self, adapter, url, timeout=None):
+        """목록 페이지 하나에서 후보 수집 (오류 시 빈 목록)"""
+        try:
+            links = self.fetch_listing(adapter, url, timeout)
+        except Exception as e:
+            print(f"Error crawling {url}: {e}")
+            return []
+        return self.select_candidates(adapter, links, url)
+
+    def discover_candidates(self, adapter):
+        """사이트맵에서 최신순 후보 수집 (사이트맵 탐색을 쓰지 않거나 찾지 못하면 빈 목록)"""
+        if not self.discovery or not adapter.site_url:
+            return []
+
+        entries = self.discovery.discover(adapter.site_url, adapter.news_sitemaps)
+        # 발행시간이 없는 항목은 뒤로
+        entries.sort(key=lambda entry: entry.published_at or '', reverse=True)
+        candidates = self.select_candidates(adapter, [(entry.url, entry.title) for entry in entries], adapter.site_url)
+        candidates = candidates[:adapter.max_links]
+
+        times = {canonicalize_url(entry.url): entry.published_at for entry in entries if entry.published_at}
+        with self._lock:
+            for full_url, title in candidates:
+                key = canonicalize_url(full_url)
+                if key in times:
+                    self.discovered_times[key] = times[key]
+        return candidates
+
+    def discovered_time(self, url):
+        """사이트맵·피드에서 얻은 발행시간 (없으면 None)"""
+        return self.discovered_times.get(canonicalize_url(url))
+
+    def feed_articles(self, adapter):
+        """RSS/Atom 피드에서 기사 수집 (피드 수집을 쓰지 않거나 피드가 없으면 빈 목록)"""
+        if not self.feed_reader or not adapter.feed_urls:
+            return []
+
+        news_items = []
+        pending = []
+        for feed_url in adapter.feed_urls:
+            for item in self.feed_reader.read(feed_url):
+                if not adapter.accept_title(item.title):
+                    continue
+                if not self.frontier.add(item.url):
+                    continue
+                full_url = item.url
+                if len(item.summary) >= adapter.min_feed_summary:
+                    article = adapter.build_article(item.title, item.summary, full_url, item.published_at)
+                    self.remember(article)
+                    news_items.append(article)
+                    continue
+                # 피드에 본문이 없으면 기사 페이지에서 수집하고 발행시간은 피드 값 사용
+                pending.append((full_url, item.title))
+                if item.published_at:
+                    with self._lock:
+                        self.discovered_times[canonicalize_url(full_url)] = item.published_at
+
+        # 결과에 남을 수 있는 건 최신 기사 max_articles개뿐이므로 그 안에 들 수 있는 기사만 상세 요청
+        times = sorted((item['publishedAt'] for item in news_items), reverse=True)
+        if len(times) >= adapter.max_articles:
+            cutoff = times[adapter.max_articles - 1]
+            pending = [
+                candidate for candidate in pending
+                if self.discovered_time(candidate[0]) is None or self.discovered_time(candidate[0]) > cutoff
+            ]
+        pending.sort(key=lambda candidate: self.discovered_time(candidate[0]) or '', reverse=True)
+        pending = pending[:min(adapter.max_candidates or adapter.max_articles, adapter.max_articles)]
+        with self._lock:
+            self.feed_fallbacks += len(pending)
+        news_items.extend(self.fetch_articles(adapter, pending))
+        return news_items
+
+    def fetch_detail(self, url, title, adapter):
+        """기사 상세 페이지 크롤링 (요청·파싱 시간 기록)"""
+        started = time.perf_counter()
+        article = self._fetch_detail(url, title, adapter)
+        self.metrics.record_detail(url, time.perf_counter() - started, article is not None)
+        return article
+
+    def _fetch_detail(self, url, title, adapter):
+        try:
+            if self.streaming:
+                result = fetch_article_stream(
+                    self.session, url,
+                    adapter.content_selectors, adapter.time_selectors,
+                    max_chars=adapter.content_limit,
+                    max_bytes=self.stream_max_bytes,
+                    timeout=self.session.timeout
+                )
+                self.metrics.record_parse('article', result['parse_seconds'])
+                published_at = adapter.parse_time(result['time_text']) if result['time_text'] else None
+                return adapter.build_article(title, result['content'], url, published_at)
+
+            response = self.session.get(url)
+            response.raise_for_status()
+            started = time.perf_counter()
+            article = adapter.parse_detail(response.content, url, title, self.parser_backend, self.selector_cache)
+            self.metrics.record_parse('article', time.perf_counter() - started)
+            return article
+
+        except Exception as e:
+            print(f"Error crawling detail for {url}: {e}")
+            return None
+
+    def record_pipeline_timings(self, pending, results, timings):
+        """파이프라인 단계별 시간을 상세 수집 지표에 기록 (요청 + 파싱 시간, 큐 대기 제외)"""
+        for (full_url, _), article, timing in zip(pending, results, timings):
+            if timing is None:
+                continue
+            fetch_seconds, parse_seconds = timing
+            if parse_seconds is not None:
+                self.metrics.record_parse('article', parse_seconds)
+            self.metrics.record_detail(full_url, fetch_seconds + (parse_seconds or 0.0), article is not None)
+
+    def fetch_articles(self, adapter, candidates, failed=None):
+        """후보 기사들의 상세 내용 수집 (증분 모드에서는 저장된 기사 재사용)
+
+        failed 목록이 주어지면 상세 수집에 실패한 기사 URL을 추가합니다.
+        """
+        news_items = []
+        pending = []
+        for full_url, title in candidates:
+            stored = self.seen_store.get(full_url) if self.seen_store else None
+            if stored:
+                with self._lock:
+                    self.reused_count += 1
+                self.remember(stored)
+                news_items.append(stored)
+            else:
+                pending.append((full_url, title))
+
+        with self._lock:
+            self.detail_fetches += len(pending)
+
+        # 상세 내용 병렬 크롤링 (요청 간격은 세션의 도메인별 속도 제한기가 조절)
+        if self.pipeline:
+            jobs = [(full_url, title, adapter, self.parser_backend, self.selector_cache) for full_url, title in pending]
+            timings = [None] * len(jobs)
+            results = self.pipeline.run(jobs, timings)
+            self.record_pipeline_timings(pending, results, timings)
+        else:
+            jobs = [(full_url, title, adapter) for full_url, title in pending]
+            results = self.fetcher.fetch_all(self.fetch_detail, jobs)
+
+        for (full_url, title), detail_data in zip(pending, results):
+            if not detail_data:
+                if failed is not None:
+                    failed.append(full_url)
+                if not adapter.keep_failed:
+                    continue
+                detail_data = adapter.build_article(title, None, full_url, None)
+            else:
+                if self.seen_store:
+                    self.seen_store.add(detail_data)
+                self.remember(detail_data)
+            # 사이트맵의 발행시간이 기사 페이지에서 읽은 값보다 정확함
+            published_at = self.discovered_time(full_url)
+            if published_at:
+                detail_data['publishedAt'] = published_at
+            news_items.append(detail_data)
+
+        return news_items
+
+    def fetch_candidates(self, adapter, candidates):
+        """소스의 후보 수 제한(max_candidates)을 적용해 상세 수집"""
+        if adapter.max_candidates:
+            candidates = candidates[:adapter.max_candidates]
+        return self.fetch_articles(adapter, candidates)
+
+    def crawl_listing(self, adapter, url, timeout=None):
+        """목록 페이지 하나의 기사 크롤링"""
+        return self.fetch_articles(adapter, self.collect_candidates(adapter, url, timeout))
+
+    def crawl_source(self, adapter, listing_urls=None):
+        """소스 하나의 목록 페이지들을 크롤링하여 최신순 기사 반환"""
+        # 피드 → 사이트맵 → 목록 페이지 순으로 기사를 찾고, max_articles개가 안 되면 다음 단계로 채움
+        # (앞 단계에서 본 기사는 프론티어가 걸러 다시 요청하지 않음)
+        news = []
+        if not listing_urls:
+            news = self.remove_duplicates(self.feed_articles(adapter))
+            if len(news) < adapter.max_articles:
+                candidates = self.discover_candidates(adapter)
+                news = self.remove_duplicates(news + self.fetch_candidates(adapter, candidates))
+
+        if len(news) < adapter.max_articles:
+            candidates = []
+            for url in listing_urls or adapter.listing_urls:
+                candidates.extend(self.collect_candidates(adapter, url))
+            news = self.remove_duplicates(news + self.fetch_candidates(adapter, candidates))
+
+        news.sort(key=newest_first, reverse=True)
+        return news[:adapter.max_articles]
+
+    def crawl_top_k(self, adapter, listing_urls, k, timeout=None):
+        """목록 페이지를 먼저 모두 받고, 목록 단계 순위(URL의 기사 번호)가 높은 후보부터
+        상세 페이지를 필요한 만큼만 받아 최신 기사 k개 반환
+
+        결과는 전체 수집 후 상위 k개를 고른 결과와 같으며, 발행시간 상한으로 후보를 제외할 수 있을 때만 요청이 줄어듭니다.
+        """
+        jobs = [(url, adapter, timeout) for url in listing_urls]
+        pages = self.fetcher.fetch_all(lambda url, adapter, timeout: self.collect_candidates(adapter, url, timeout), jobs)
+        return self.fetch_top_k(adapter, [candidate for page in pages for candidate in page or []], k)
+
+    def published_bound(self, adapter, url):
+        """상세 페이지를 받기 전에 알 수 있는 발행시간 상한 (알 수 없으면 None)
+
+        사이트맵·피드의 발행시간은 그대로 기사 발행시간이 되므로 정확한 값이고,
+        없으면 기사 번호의 발행일로 추정합니다.
+        """
+        return self.discovered_time(url) or adapter.listing_time_bound(url)
+
+    def fetch_top_k(self, adapter, candidates, k):
+        """발행시간이 늦을 수 있는 후보부터 상세 페이지를 받아 최신 기사 k개가 확정되면 중단
+
+        후보 순서는 사이트맵·피드 발행시간, 없으면 기사 번호의 발행일·번호 순이며,
+        발행시간을 알 수 없는 후보는 어떤 기사보다 최신일 수 있으므로 모두 받습니다.
+        k개를 얻은 뒤에도 k번째 기사보다 최신일 수 있는 후보가 남아 있으면 계속 받습니다.
+        """
+        # 알 수 없는 상한은 가장 큰 값으로 취급 (입력 순서 유지)
+        unknown = '\uffff'
+        bounds = {url: self.published_bound(adapter, url) or unknown for url, title in candidates}
+        queue = sorted(
+            candidates,
+            key=lambda candidate: (bounds[candidate[0]], adapter.listing_rank(candidate[0]) or ()),
+            reverse=True
+        )
+
+        news = []
+        fetched = 0
+        while queue:
+            if len(news) >= k:
+                # k번째 기사보다 최신일 수 없는 후보는 받지 않음 (같은 시각은 URL 순서로 앞설 수 있어 받음)
+                cutoff = news[k - 1].get('publishedAt', '')
+                queue = [candidate for candidate in queue if bounds[candidate[0]] >= cutoff]
+                if not queue:
+                    break
+            size = k - len(news) if len(news) < k else k
+            batch, queue = queue[:size], queue[size:]
+            fetched += len(batch)
+            news = self.remove_duplicates(news + self.fetch_articles(adapter, batch))
+            news.sort(key=newest_first, reverse=True)
+
+        with self._lock:
+            self.top_k_fetched += fetched
+            self.top_k_candidates += len(candidates)
+
+        news.sort(key=newest_first, reverse=True)
+        return news[:k]
+
+    def crawl_parallel(self, tasks, source_timeout=None):
+        """(이름, 함수) 소스 작업들을 동시에 실행하고 이름별 기사 목록 반환
+
+        각 소스는 시작 시점부터 source_timeout초 안에 끝나야 하며,
+        시간 초과나 오류가 난 소스는 빈 목록으로 처리하고 나머지 결과만 병합합니다.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return {}
+        source_timeout = source_timeout or self.source_timeout
+
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=len(tasks))
+        try:
+            started = time.monotonic()
+            futures = [(name, executor.submit(func)) for name, func in tasks]
+            for name, future in futures:
+                remaining = None
+                if source_timeout:
+                    remaining = max(0.0, started + source_timeout - time.monotonic())
+                try:
+                    results[name] = future.result(timeout=remaining) or []
+                except FutureTimeoutError:
+                    print(f"Timed out crawling {name} news after {source_timeout}s; skipping")
+                    results[name] = []
+                except Exception as e:
+                    print(f"Error crawling {name} news: {e}")
+                    results[name] = []
+        finally:
+            # 멈춘 소스를 기다리지 않음 (진행 중인 요청은 세션 타임아웃으로 끝남)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def crawl_sources(self, adapters, limit=None):
+        """여러 소스를 동시에 크롤링하여 중복 제거 후 최신순으로 병합"""
+        self.start_run()
+        adapters = list(adapters)
+        for adapter in adapters:
+            print(f"Crawling {adapter.name} news...")
+        results = self.crawl_parallel(
+            (adapter.name, lambda adapter=adapter: self.crawl_source(adapter)) for adapter in adapters
+        )
+
+        all_news = []
+        for adapter in adapters:
+            news = results[adapter.name]
+            print(f"Found {len(news)} {adapter.name} news items")
+            all_news.extend(news)
+
+        unique_news = self.remove_duplicates(all_news)
+        unique_news.sort(key=newest_first, reverse=True)
+        return unique_news[:limit] if limit else unique_news
+
+    def remove_duplicates(self, news_list):
+        """중복 뉴스 제거"""
+        seen_titles = set()
+        unique_news = []
+
+        for news in news_list:
+            title = news['title'].strip()
+            if title not in seen_titles and len(title) > 10:
+                seen_titles.add(title)
+                unique_news.append(news)
+
+        if self.near_duplicate_detector:
+            filtered = self.near_duplicate_detector.filter(unique_news)
+            with self._lock:
+                self.near_duplicates_removed += len(unique_news) - len(filtered)
+            unique_news = filtered
+
+        return unique_news
+
+    def report(self):
+        """실행 통계 출력"""
+        print("Requests:")
+        for line in self.metrics.summary_lines():
+            print(line)
+        stats = self.frontier.stats()
+        print(f"Frontier: {stats['added']} unique article URLs seen, {self.detail_fetches} detail pages fetched, "
+              f"{stats['skipped']} duplicate fetches avoided")
+        if self.top_k_candidates:
+            print(f"Early stop: {self.top_k_fetched}/{self.top_k_candidates} candidates fetched "
+                  f"({self.top_k_candidates - self.top_k_fetched} detail requests avoided)")
+        if self.feed_reader:
+            stats = self.feed_reader.stats()
+            print(f"Feeds: {stats['requests']} requests ({stats['not_modified']} not modified), "
+                  f"{stats['items']} items, {self.feed_fallbacks} detail fetches, {stats['errors']} errors")
+        if self.discovery:
+            stats = self.discovery.stats()
+            print(f"Sitemaps: {stats['requests']} requests, {stats['entries']} entries, {stats['errors']} errors")
+        if self.session.cache is not None:
+            stats = self.session.cache.stats()
+            print(f"HTTP cache: {stats['hits']} responses revalidated (304), {stats['misses']} downloaded")
+        if self.seen_store:
+            print(f"Incremental: {self.reused_count} previously crawled articles reused without fetching")
+        if self.session.archive is not None:
+            stats = self.session.archive.stats()
+            print(f"Archive ({stats['mode']}): {stats['recorded']} recorded, {stats['replayed']} replayed, "
+                  f"{stats['missed']} missing")
+        breaker = self.session.breaker
+        if breaker.trips or breaker.skipped:
+            open_hosts = ', '.join(breaker.open_hosts()) or 'none'
+            print(f"Circuit breaker: {breaker.trips} hosts tripped, {breaker.skipped} requests skipped "
+                  f"(still open: {open_hosts})")
+        stats = self.selector_cache.stats()
+        if stats['hits'] or stats['learned'] or stats['density_fallbacks']:
+            print(f"Selectors: {stats['hits']} learned selector hits, {stats['learned']} newly learned, "
+                  f"{stats['density_fallbacks']} text-density fallbacks")
+        if self.near_duplicate_detector:
+            print(f"Near-duplicates: {self.near_duplicates_removed} articles removed")
+        if self.pipeline:
+            stats = self.pipeline.stats()
+            print(f"Pipeline: fetched {stats['fetched']} pages ({stats['fetch_pages_per_sec']:.1f}/s), "
+                  f"parsed {stats['parsed']} ({stats['parse_pages_per_sec']:.1f}/s), "
+                  f"max queue depth {stats['max_queue_depth']}/{stats['queue_size']}")
+
+    def close(self):
+        """파이프라인 프로세스 풀과 커넥션 풀 종료 (학습한 선택자 저장)"""
+        self.selector_cache.save()
+        if self.pipeline:
+            self.pipeline.close()
+        self.session.close()
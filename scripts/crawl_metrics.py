@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+크롤링 실행 지표
+세션 요청(호스트별 응답 시간·크기·상태 코드), HTML 파싱 시간, 기사 상세 수집 시간, 초당 기사 수를 모아
+실행이 끝나면 data/news.json 옆에 JSON과 Prometheus 텍스트 형식 보고서로 저장합니다.
+느려진 실행이 네트워크 때문인지, 특정 소스 때문인지, 파싱 때문인지 구분하고 동시성 설정을 조정하는 데 사용합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+
+# 히스토그램 구간 상한 (Prometheus le 레이블)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 10 * 1024, 50 * 1024, 100 * 1024, 250 * 1024, 500 * 1024, 1024 * 1024)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def host_of(url):
+    return (urlsplit(url).hostname or '').lower()
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """구간별 누적 개수 [(상한, 개수)] (마지막은 '+Inf')"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        result.append(('+Inf', self.count))
+        return result
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'avg': round(self.sum / self.count, 6) if self.count else 0.0,
+            'buckets': {str(bound): count for bound, count in self.cumulative()}
+        }
+
+
+class CrawlMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """실행 단위 지표 초기화"""
+        with self._lock:
+            self.started = time.time()
+            self.finished = None
+            # 호스트별 {'latency', 'bytes', 'status': {코드: 횟수}, 'origin': {출처: 횟수}, 'errors', 'skipped'}
+            self.hosts = {}
+            # 종류('listing', 'article')별 파싱 시간
+            self.parse = {}
+            # 호스트별 기사 상세 수집 시간 (요청 + 파싱)
+            self.details = {}
+            self.articles_parsed = 0
+            self.articles_returned = 0
+
+    def _host(self, host):
+        if host not in self.hosts:
+            self.hosts[host] = {
+                'latency': Histogram(LATENCY_BUCKETS),
+                'bytes': Histogram(SIZE_BUCKETS),
+                'status': {},
+                'origin': {},
+                'errors': 0,
+                'skipped': 0
+            }
+        return self.hosts[host]
+
+    def record_request(self, url, status, seconds, size, origin='network'):
+        """세션 요청 하나 기록 (status가 None이면 연결 오류)"""
+        with self._lock:
+            entry = self._host(host_of(url))
+            entry['latency'].observe(seconds)
+            if status is None:
+                entry['errors'] += 1
+                return
+            entry['bytes'].observe(size)
+            entry['status'][str(status)] = entry['status'].get(str(status), 0) + 1
+            entry['origin'][origin] = entry['origin'].get(origin, 0) + 1
+
+    def record_skip(self, url):
+        """서킷 브레이커가 열려 보내지 않은 요청 기록"""
+        with self._lock:
+            self._host(host_of(url))['skipped'] += 1
+
+    def record_parse(self, kind, seconds):
+        with self._lock:
+            if kind not in self.parse:
+                self.parse[kind] = Histogram(PARSE_BUCKETS)
+            self.parse[kind].observe(seconds)
+
+    def record_detail(self, url, seconds, success):
+        with self._lock:
+            host = host_of(url)
+            if host not in self.details:
+                self.details[host] = Histogram(LATENCY_BUCKETS)
+            self.details[host].observe(seconds)
+            if success:
+                self.articles_parsed += 1
+
+    def finish(self, articles_returned):
+        """실행 종료 시각과 최종 기사 수 기록"""
+        with self._lock:
+            self.finished = time.time()
+            self.articles_returned = articles_returned
+
+    def duration(self):
+        return (self.finished or time.time()) - self.started
+
+    def to_dict(self):
+        with self._lock:
+            duration = self.duration()
+            return {
+                'startedAt': datetime.fromtimestamp(self.started).isoformat(),
+                'durationSeconds': round(duration, 3),
+                'articlesParsed': self.articles_parsed,
+                'articlesReturned': self.articles_returned,
+                'articlesPerSecond': round(self.articles_parsed / duration, 3) if duration else 0.0,
+                'hosts': {
+                    host: {
+                        'requests': entry['latency'].count,
+                        'errors': entry['errors'],
+                        'skipped': entry['skipped'],
+                        'status': dict(entry['status']),
+                        'origin': dict(entry['origin']),
+                        'latencySeconds': entry['latency'].to_dict(),
+                        'responseBytes': entry['bytes'].to_dict()
+                    }
+                    for host, entry in sorted(self.hosts.items())
+                },
+                'parseSeconds': {kind: histogram.to_dict() for kind, histogram in sorted(self.parse.items())},
+                'detailSeconds': {host: histogram.to_dict() for host, histogram in sorted(self.details.items())}
+            }
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+
+        def histogram(name, help_text, label, series):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for value, hist in series:
+                for bound, count in hist.cumulative():
+                    lines.append(f'{name}_bucket{{{label}="{value}",le="{bound}"}} {count}')
+                lines.append(f'{name}_sum{{{label}="{value}"}} {hist.sum:.6f}')
+                lines.append(f'{name}_count{{{label}="{value}"}} {hist.count}')
+
+        with self._lock:
+            hosts = sorted(self.hosts.items())
+            histogram('crawl_request_duration_seconds', 'HTTP response time per host.', 'host',
+                      [(host, entry['latency']) for host, entry in hosts])
+            histogram('crawl_response_bytes', 'HTTP response body size per host.', 'host',
+                      [(host, entry['bytes']) for host, entry in hosts])
+
+            lines.append('# HELP crawl_responses_total HTTP responses per host, status code and origin.')
+            lines.append('# TYPE crawl_responses_total counter')
+            for host, entry in hosts:
+                for status, count in sorted(entry['status'].items()):
+                    lines.append(f'crawl_responses_total{{host="{host}",status="{status}"}} {count}')
+            lines.append('# HELP crawl_responses_by_origin_total Responses served from network, cache or archive.')
+            lines.append('# TYPE crawl_responses_by_origin_total counter')
+            for host, entry in hosts:
+                for origin, count in sorted(entry['origin'].items()):
+                    lines.append(f'crawl_responses_by_origin_total{{host="{host}",origin="{origin}"}} {count}')
+            lines.append('# HELP crawl_request_errors_total Requests that failed without a response.')
+            lines.append('# TYPE crawl_request_errors_total counter')
+            for host, entry in hosts:
+                lines.append(f'crawl_request_errors_total{{host="{host}"}} {entry["errors"]}')
+            lines.append('# HELP crawl_requests_skipped_total Requests skipped because the host circuit was open.')
+            lines.append('# TYPE crawl_requests_skipped_total counter')
+            for host, entry in hosts:
+                lines.append(f'crawl_requests_skipped_total{{host="{host}"}} {entry["skipped"]}')
+
+            histogram('crawl_parse_duration_seconds', 'HTML parse and extraction time.', 'kind',
+                      sorted(self.parse.items()))
+            histogram('crawl_detail_duration_seconds', 'Article detail fetch and parse time per host.', 'host',
+                      sorted(self.details.items()))
+
+            duration = self.duration()
+            lines.append('# HELP crawl_articles_parsed_total Article pages fetched and parsed.')
+            lines.append('# TYPE crawl_articles_parsed_total counter')
+            lines.append(f'crawl_articles_parsed_total {self.articles_parsed}')
+            lines.append('# HELP crawl_articles_returned Articles in the final output.')
+            lines.append('# TYPE crawl_articles_returned gauge')
+            lines.append(f'crawl_articles_returned {self.articles_returned}')
+            lines.append('# HELP crawl_run_duration_seconds Wall time of the crawl run.')
+            lines.append('# TYPE crawl_run_duration_seconds gauge')
+            lines.append(f'crawl_run_duration_seconds {duration:.3f}')
+            lines.append('# HELP crawl_articles_per_second Parsed articles per second of wall time.')
+            lines.append('# TYPE crawl_articles_per_second gauge')
+            lines.append(f'crawl_articles_per_second {self.articles_parsed / duration if duration else 0.0:.3f}')
+
+        return '\n'.join(lines) + '\n'
+
+    def summary_lines(self):
+        """실행 통계 출력용 호스트별 요약"""
+        with self._lock:
+            lines = []
+            for host, entry in sorted(self.hosts.items()):
+                latency, size = entry['latency'], entry['bytes']
+                avg_ms = latency.sum / latency.count * 1000 if latency.count else 0.0
+                avg_kb = size.sum / size.count / 1024 if size.count else 0.0
+                lines.append(f"  {host}: {latency.count} requests, avg {avg_ms:.0f} ms, avg {avg_kb:.1f} KB, "
+                             f"status {dict(sorted(entry['status'].items()))}, {entry['errors']} errors, "
+                             f"{entry['skipped']} skipped")
+            for kind, hist in sorted(self.parse.items()):
+                lines.append(f"  parse {kind}: {hist.count} pages, avg {hist.sum / hist.count * 1000:.1f} ms")
+            return lines
+
+    def write_report(self, output_dir, name='crawl_metrics'):
+        """JSON과 Prometheus 텍스트 보고서 저장 후 경로 반환"""
+        os.makedirs(output_dir, exist_ok=True)
+        json_path = os.path.join(output_dir, f'{name}.json')
+        prom_path = os.path.join(output_dir, f'{name}.prom')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(prom_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
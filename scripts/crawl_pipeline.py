@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+수집/파싱 분리 크롤링 파이프라인
+I/O 스레드가 페이지를 내려받아 제한된 크기의 큐에 넣고,
+프로세스 풀이 큐에서 HTML을 꺼내 기사 데이터로 파싱합니다.
+네트워크 요청이 CPU 파싱을 기다리지 않고, 파싱은 모든 코어를 사용합니다.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+_DONE = object()
+
+
+def _timed_parse(parse_func, content, *args):
+    """파싱 실행기에서 호출: 파싱 결과와 파싱에 걸린 시간(대기 시간 제외) 반환"""
+    start = time.perf_counter()
+    result = parse_func(content, *args)
+    return result, time.perf_counter() - start
+
+
+class CrawlPipeline:
+    def __init__(self, session, parse_func, fetch_workers=8, parse_workers=None, queue_size=32,
+                 use_processes=True, timeout=10):
+        self.session = session
+        # 프로세스 풀에서 실행되므로 모듈 최상위 함수여야 함: parse_func(content, url, *args)
+        self.parse_func = parse_func
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 2
+        self.queue_size = queue_size
+        self.use_processes = use_processes
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """단계별 처리량 통계 초기화"""
+        self.fetched = 0
+        self.fetch_errors = 0
+        self.parsed = 0
+        self.parse_errors = 0
+        self.bytes_fetched = 0
+        self.fetch_seconds = 0.0
+        self.max_queue_depth = 0
+        # 하나 이상의 run()이 실행 중이던 시간 (동시에 실행된 run()은 한 번만 셈)
+        self.elapsed = 0.0
+        self._active_runs = 0
+        self._active_since = None
+        self._queue = None
+
+    def _parse_executor(self):
+        """파싱용 실행기 (처음 사용할 때 생성하여 재사용)"""
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    # 스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.parse_workers,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.parse_workers)
+            return self._executor
+
+    def _run_started(self):
+        with self._lock:
+            if self._active_runs == 0:
+                self._active_since = time.perf_counter()
+            self._active_runs += 1
+
+    def _run_finished(self):
+        with self._lock:
+            self._active_runs -= 1
+            if self._active_runs == 0:
+                self.elapsed += time.perf_counter() - self._active_since
+                self._active_since = None
+
+    def _fetch(self, index, job, html_queue, timings):
+        """I/O 단계: 페이지를 받아 큐에 넣음 (큐가 가득 차면 대기)"""
+        url = job[0]
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            content = response.content
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            with self._lock:
+                self.fetch_errors += 1
+            if timings is not None:
+                timings[index] = (time.perf_counter() - start, None)
+            return
+
+        seconds = time.perf_counter() - start
+        if timings is not None:
+            timings[index] = (seconds, None)
+        with self._lock:
+            self.fetched += 1
+            self.bytes_fetched += len(content)
+            self.fetch_seconds += seconds
+        html_queue.put((index, job, content))
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, html_queue.qsize())
+
+    def _dispatch(self, executor, html_queue, results, timings):
+        """큐에서 HTML을 꺼내 파싱 실행기로 전달 (동시 파싱 수 제한으로 큐에 백프레셔 유지)"""
+        in_flight = threading.BoundedSemaphore(self.parse_workers * 2)
+        futures = []
+
+        while True:
+            item = html_queue.get()
+            if item is _DONE:
+                break
+            index, job, content = item
+            in_flight.acquire()
+            try:
+                future = executor.submit(_timed_parse, self.parse_func, content, job[0], *job[1:])
+            except Exception as e:
+                # 실행기 오류가 나도 큐는 계속 비워야 I/O 스레드가 멈추지 않음
+                in_flight.release()
+                print(f"Error scheduling parse for {job[0]}: {e}")
+                with self._lock:
+                    self.parse_errors += 1
+                continue
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append((index, job[0], future))
+
+        for index, url, future in futures:
+            try:
+                results[index], seconds = future.result()
+                if timings is not None:
+                    timings[index] = (timings[index][0], seconds)
+                with self._lock:
+                    self.parsed += 1
+            except Exception as e:
+                print(f"Error parsing {url}: {e}")
+                with self._lock:
+                    self.parse_errors += 1
+
+    def run(self, jobs, timings=None):
+        """(url, *args) 작업을 수집→파싱하고 입력 순서대로 결과 반환 (실패는 None)
+
+        timings 목록(작업 수만큼의 None)이 주어지면 작업마다 (수집 시간, 파싱 시간)을 기록합니다.
+        파싱까지 가지 못한 작업의 파싱 시간은 None이고, 요청하지 못한 작업은 None으로 남습니다.
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        if not jobs:
+            return results
+
+        # 실행기를 만들 수 없으면 페이지를 받기 전에 오류를 알림 (디스패처가 죽으면 I/O 스레드가 큐에서 멈춤)
+        executor = self._parse_executor()
+        html_queue = queue.Queue(maxsize=self.queue_size)
+        self._queue = html_queue
+        dispatcher = threading.Thread(target=self._dispatch, args=(executor, html_queue, results, timings), daemon=True)
+
+        self._run_started()
+        try:
+            dispatcher.start()
+            with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(jobs))) as fetchers:
+                for index, job in enumerate(jobs):
+                    fetchers.submit(self._fetch, index, job, html_queue, timings)
+            html_queue.put(_DONE)
+            dispatcher.join()
+        finally:
+            self._run_finished()
+        return results
+
+    def stats(self):
+        """큐 깊이와 단계별 처리량"""
+        elapsed = self.elapsed or 1e-9
+        return {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'max_queue_depth': self.max_queue_depth,
+            'queue_size': self.queue_size,
+            'fetched': self.fetched,
+            'fetch_errors': self.fetch_errors,
+            'parsed': self.parsed,
+            'parse_errors': self.parse_errors,
+            'bytes_fetched': self.bytes_fetched,
+            'fetch_pages_per_sec': self.fetched / elapsed,
+            'parse_pages_per_sec': self.parsed / elapsed,
+            'avg_fetch_latency': self.fetch_seconds / self.fetched if self.fetched else 0.0,
+            'elapsed': self.elapsed
+        }
+
+    def close(self):
+        """파싱 실행기 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+크롤러 공용 HTTP 세션
+모든 크롤러의 요청이 거쳐 가는 requests.Session 확장으로,
+요청 속도 제한, 디스크 HTTP 캐시(조건부 GET), 재시도와 호스트별 서킷 브레이커를 적용하고,
+아카이브가 설정되면 응답을 녹화하거나 녹화된 응답을 재생합니다.
+metrics가 설정되면 요청마다 호스트별 응답 시간, 크기, 상태 코드를 기록합니다.
+host_overrides로 특정 호스트의 요청을 다른 서버(예: 로컬 가상 뉴스 서버)로 보낼 수 있습니다.
+속도 제한, 서킷 브레이커, 캐시와 아카이브는 원래 URL을 기준으로 동작하고, 실제 전송할 때만 서버를 바꿉니다.
+"""
+
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from retry_policy import BLOCKED_STATUSES, CircuitOpenError
+
+
+def _response_size(response):
+    """응답 본문 크기 (스트리밍으로 아직 읽지 않은 본문은 Content-Length)"""
+    if response._content is not False:
+        return len(response._content or b'')
+    try:
+        return int(response.headers.get('Content-Length') or 0)
+    except ValueError:
+        return 0
+
+
+class CrawlSession(requests.Session):
+    # 요청에 timeout을 주지 않았을 때 사용할 기본값 (초 또는 (연결, 읽기))
+    timeout = None
+
+    def __init__(self, rate_limiter=None, cache=None, retry=None, breaker=None, archive=None, metrics=None):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.retry = retry
+        self.breaker = breaker
+        self.archive = archive
+        self.metrics = metrics
+        # {'www.hankyung.com': 'http://127.0.0.1:8800'}: 경로는 유지하고 서버만 바꾸며 Host 헤더는 원래 호스트로 보냄
+        self.host_overrides = {}
+
+    def _apply_host_override(self, url, kwargs):
+        """호스트 대체 규칙이 있으면 요청 URL과 Host 헤더 변경"""
+        parts = urlsplit(url)
+        target = self.host_overrides.get(parts.hostname)
+        if not target:
+            return url
+        target = urlsplit(target)
+        headers = dict(kwargs.get('headers') or {})
+        headers['Host'] = parts.netloc
+        kwargs['headers'] = headers
+        return urlunsplit((target.scheme, target.netloc, parts.path, parts.query, ''))
+
+    def request(self, method, url, *args, **kwargs):
+        """요청하고 (metrics가 있으면) 응답 시간·크기·상태 코드 기록"""
+        if self.metrics is None:
+            return self._request(method, url, *args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = self._request(method, url, *args, **kwargs)
+        except CircuitOpenError:
+            # 보내지 않은 요청은 응답 시간에 넣지 않고 따로 셈
+            self.metrics.record_skip(url)
+            raise
+        except Exception:
+            self.metrics.record_request(url, None, time.perf_counter() - started, 0)
+            raise
+        self.metrics.record_request(
+            url, response.status_code, time.perf_counter() - started, _response_size(response),
+            'archive' if getattr(response, 'from_archive', False)
+            else 'cache' if getattr(response, 'from_cache', False) else 'network'
+        )
+        return response
+
+    def _request(self, method, url, *args, **kwargs):
+        """요청 전 도메인별 속도 제한 적용, GET 요청은 캐시 검증"""
+        if self.archive is not None and self.archive.replaying:
+            # 재생 모드: 네트워크, 속도 제한, 캐시 없이 녹화된 응답만 사용
+            return self.archive.replay(url)
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        # 스트리밍 요청은 본문을 끝까지 읽지 않으므로 캐시하지 않음
+        use_cache = self.cache is not None and method.upper() == 'GET' and not kwargs.get('stream')
+        entry = self.cache.get(url) if use_cache else None
+        if entry:
+            headers = dict(kwargs.get('headers') or {})
+            headers.update(self.cache.conditional_headers(entry))
+            kwargs['headers'] = headers
+
+        response = self._send(method, url, *args, **kwargs)
+
+        if entry and response.status_code == 304:
+            self.cache.record(hit=True)
+            response = self.cache.build_response(entry, response)
+        elif use_cache:
+            self.cache.record(hit=False)
+            self.cache.store(url, response)
+
+        if self.archive is not None:
+            # 스트리밍 응답도 본문 전체를 읽어 녹화 (이후 iter_content는 읽은 본문에서 제공)
+            self.archive.record(url, response)
+        return response
+
+    def _send(self, method, url, *args, **kwargs):
+        """서킷 브레이커 확인 후 요청, 일시적 오류는 백오프하며 재시도"""
+        if self.breaker and not self.breaker.allow(url):
+            raise CircuitOpenError(f"Circuit open for {url}; skipping request")
+
+        # 호스트 대체는 전송 직전에만 적용 (속도 제한·서킷은 원래 호스트별로 유지)
+        target_url = self._apply_host_override(url, kwargs) if self.host_overrides else url
+        max_retries = self.retry.max_retries if self.retry else 0
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            try:
+                response = super().request(method, target_url, *args, **kwargs)
+            except requests.RequestException as e:
+                if self.retry and attempt < max_retries and self.retry.is_retryable_error(e):
+                    time.sleep(self.retry.delay(attempt))
+                    attempt += 1
+                    continue
+                if self.breaker:
+                    self.breaker.record_failure(url)
+                raise
+
+            if self.retry and self.retry.is_retryable_response(response):
+                if attempt < max_retries:
+                    delay = self.retry.delay(attempt, response)
+                    response.close()
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                if self.breaker:
+                    self.breaker.record_failure(url)
+                return response
+
+            if self.breaker:
+                # 차단 응답은 실패로 세고, 404 같은 다른 4xx는 호스트 상태와 무관하므로 기록하지 않음
+                if response.status_code in BLOCKED_STATUSES:
+                    self.breaker.record_failure(url)
+                elif response.status_code < 400:
+                    self.breaker.record_success(url)
+            return response
@@ -4,327 +4,89 @@
 네이버, 한국경제, 매일경제, 연합뉴스에서 경제 뉴스를 수집합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
-import time
-import re
-from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
+from datetime import datetime
 import os
 import sys
 
+from crawl_engine import CrawlEngine
+from source_adapters import HankyungAdapter, MKAdapter, NaverAdapter, YNAAdapter
+from time_parser import now_iso, parse_time
+
+# 소스별 공통 설정: 본문 500자, 최대 10개, 상세 요청이 실패해도 제목은 유지
+SOURCE_SETTINGS = {
+    'content_limit': 500,
+    'max_candidates': 10,
+    'max_articles': 10,
+    'keep_failed': True
+}
+
 class NewsCrawler:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        # SSL 검증 우회 (개발/테스트 환경에서만)
-        self.session.verify = False
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    def __init__(self, requests_per_second=1.0, use_cache=True, parser_backend=None, source_timeout=60):
+        # 속도 제한, 캐시, 파서 백엔드는 공통 크롤링 엔진이 관리
+        self.engine = CrawlEngine(
+            requests_per_second=requests_per_second,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            },
+            use_cache=use_cache,
+            parser_backend=parser_backend,
+            source_timeout=source_timeout
+        )
+        # 네이버는 메인 뉴스 묶음(.cluster_group)에서만 링크 수집
+        self.naver = NaverAdapter(
+            link_mode='full',
+            link_selectors=['.cluster_group a'],
+            link_patterns=('news.naver.com',),
+            links_per_selector=9,
+            title_keyword=None,
+            **SOURCE_SETTINGS
+        )
+        self.hankyung = HankyungAdapter(max_links=20, **SOURCE_SETTINGS)
+        self.mk = MKAdapter(max_links=20, **SOURCE_SETTINGS)
+        self.yna = YNAAdapter(max_links=20, **SOURCE_SETTINGS)
+        self.session = self.engine.session
         self.news_data = []
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.base_dir = self.engine.base_dir
         
     def crawl_naver_news(self):
         """네이버 뉴스 경제 섹션 크롤링"""
-        try:
-            url = "https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1=101"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_items = []
-            
-            # 메인 뉴스 섹션
-            main_news = soup.find_all('div', class_='cluster_group')
-            
-            for group in main_news[:3]:  # 상위 3개 그룹만
-                links = group.find_all('a', href=True)
-                for link in links[:3]:  # 각 그룹에서 3개씩
-                    if link.get('href') and 'news.naver.com' in link.get('href'):
-                        title = link.get_text(strip=True)
-                        if title and len(title) > 10:
-                            news_items.append({
-                                'title': title,
-                                'url': link.get('href'),
-                                'source': '네이버뉴스'
-                            })
-            
-            # 상세 내용 크롤링
-            for item in news_items[:10]:
-                try:
-                    detail_response = self.session.get(item['url'], timeout=10)
-                    detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                    
-                    # 본문 추출
-                    content_div = detail_soup.find('div', {'id': 'newsct_article'})
-                    if content_div:
-                        content = content_div.get_text(strip=True)
-                        item['content'] = content[:500]  # 500자로 제한
-                    
-                    # 발행시간 추출
-                    time_elem = detail_soup.find('span', class_='t11')
-                    if time_elem:
-                        item['publishedAt'] = self.parse_naver_time(time_elem.get_text())
-                    else:
-                        item['publishedAt'] = datetime.now().isoformat()
-                    
-                    time.sleep(1)  # 요청 간격 조절
-                    
-                except Exception as e:
-                    print(f"Error crawling detail for {item['url']}: {e}")
-                    item['content'] = ""
-                    item['publishedAt'] = datetime.now().isoformat()
-            
-            return news_items[:10]
-            
-        except Exception as e:
-            print(f"Error crawling Naver news: {e}")
-            return []
+        return self.engine.crawl_source(self.naver)
     
     def crawl_hankyung_news(self):
         """한국경제신문 크롤링"""
-        try:
-            url = "https://www.hankyung.com/economy"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_items = []
-            
-            # 뉴스 링크 추출
-            news_links = soup.find_all('a', href=True)
-            
-            for link in news_links[:20]:
-                href = link.get('href')
-                if href and '/article/' in href:
-                    title = link.get_text(strip=True)
-                    if title and len(title) > 10:
-                        full_url = urljoin(url, href)
-                        news_items.append({
-                            'title': title,
-                            'url': full_url,
-                            'source': '한국경제'
-                        })
-            
-            # 상세 내용 크롤링
-            for item in news_items[:10]:
-                try:
-                    detail_response = self.session.get(item['url'], timeout=10)
-                    detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                    
-                    # 본문 추출
-                    content_div = detail_soup.find('div', class_='article-body')
-                    if content_div:
-                        content = content_div.get_text(strip=True)
-                        item['content'] = content[:500]
-                    
-                    # 발행시간 추출
-                    time_elem = detail_soup.find('time')
-                    if time_elem:
-                        item['publishedAt'] = self.parse_time(time_elem.get('datetime'))
-                    else:
-                        item['publishedAt'] = datetime.now().isoformat()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error crawling detail for {item['url']}: {e}")
-                    item['content'] = ""
-                    item['publishedAt'] = datetime.now().isoformat()
-            
-            return news_items[:10]
-            
-        except Exception as e:
-            print(f"Error crawling Hankyung news: {e}")
-            return []
+        return self.engine.crawl_source(self.hankyung)
     
     def crawl_mk_news(self):
         """매일경제신문 크롤링"""
-        try:
-            url = "https://www.mk.co.kr/news/economy/"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_items = []
-            
-            # 뉴스 링크 추출
-            news_links = soup.find_all('a', href=True)
-            
-            for link in news_links[:20]:
-                href = link.get('href')
-                if href and '/news/economy/' in href and 'view' in href:
-                    title = link.get_text(strip=True)
-                    if title and len(title) > 10:
-                        full_url = urljoin(url, href)
-                        news_items.append({
-                            'title': title,
-                            'url': full_url,
-                            'source': '매일경제'
-                        })
-            
-            # 상세 내용 크롤링
-            for item in news_items[:10]:
-                try:
-                    detail_response = self.session.get(item['url'], timeout=10)
-                    detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                    
-                    # 본문 추출
-                    content_div = detail_soup.find('div', class_='news_cnt_detail_wrap')
-                    if content_div:
-                        content = content_div.get_text(strip=True)
-                        item['content'] = content[:500]
-                    
-                    # 발행시간 추출
-                    time_elem = detail_soup.find('span', class_='time')
-                    if time_elem:
-                        item['publishedAt'] = self.parse_time(time_elem.get_text())
-                    else:
-                        item['publishedAt'] = datetime.now().isoformat()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error crawling detail for {item['url']}: {e}")
-                    item['content'] = ""
-                    item['publishedAt'] = datetime.now().isoformat()
-            
-            return news_items[:10]
-            
-        except Exception as e:
-            print(f"Error crawling MK news: {e}")
-            return []
+        return self.engine.crawl_source(self.mk)
     
     def crawl_yna_news(self):
         """연합뉴스 경제 섹션 크롤링"""
-        try:
-            url = "https://www.yna.co.kr/economy"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_items = []
-            
-            # 뉴스 링크 추출
-            news_links = soup.find_all('a', href=True)
-            
-            for link in news_links[:20]:
-                href = link.get('href')
-                if href and '/economy/' in href and 'view' in href:
-                    title = link.get_text(strip=True)
-                    if title and len(title) > 10:
-                        full_url = urljoin(url, href)
-                        news_items.append({
-                            'title': title,
-                            'url': full_url,
-                            'source': '연합뉴스'
-                        })
-            
-            # 상세 내용 크롤링
-            for item in news_items[:10]:
-                try:
-                    detail_response = self.session.get(item['url'], timeout=10)
-                    detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                    
-                    # 본문 추출
-                    content_div = detail_soup.find('div', class_='story-news')
-                    if content_div:
-                        content = content_div.get_text(strip=True)
-                        item['content'] = content[:500]
-                    
-                    # 발행시간 추출
-                    time_elem = detail_soup.find('span', class_='publish-time')
-                    if time_elem:
-                        item['publishedAt'] = self.parse_time(time_elem.get_text())
-                    else:
-                        item['publishedAt'] = datetime.now().isoformat()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error crawling detail for {item['url']}: {e}")
-                    item['content'] = ""
-                    item['publishedAt'] = datetime.now().isoformat()
-            
-            return news_items[:10]
-            
-        except Exception as e:
-            print(f"Error crawling YNA news: {e}")
-            return []
+        return self.engine.crawl_source(self.yna)
     
     def parse_naver_time(self, time_str):
         """네이버 시간 형식 파싱"""
-        try:
-            now = datetime.now()
-            if '분 전' in time_str:
-                minutes = int(re.search(r'(\d+)분', time_str).group(1))
-                return (now - timedelta(minutes=minutes)).isoformat()
-            elif '시간 전' in time_str:
-                hours = int(re.search(r'(\d+)시간', time_str).group(1))
-                return (now - timedelta(hours=hours)).isoformat()
-            else:
-                return now.isoformat()
-        except:
-            return datetime.now().isoformat()
+        return parse_time(time_str) or now_iso()
     
     def parse_time(self, time_str):
         """일반적인 시간 형식 파싱"""
-        try:
-            # ISO 형식인 경우
-            if 'T' in time_str:
-                return datetime.fromisoformat(time_str.replace('Z', '+00:00')).isoformat()
-            # 한국 시간 형식인 경우
-            elif re.match(r'\d{4}-\d{2}-\d{2}', time_str):
-                return datetime.strptime(time_str, '%Y-%m-%d').isoformat()
-            else:
-                return datetime.now().isoformat()
-        except:
-            return datetime.now().isoformat()
+        return parse_time(time_str) or now_iso()
     
     def remove_duplicates(self, news_list):
         """중복 뉴스 제거"""
-        seen_titles = set()
-        unique_news = []
-        
-        for news in news_list:
-            title = news['title'].strip()
-            if title not in seen_titles and len(title) > 10:
-                seen_titles.add(title)
-                unique_news.append(news)
-        
-        return unique_news
+        return self.engine.remove_duplicates(news_list)
     
     def crawl_all_news(self):
         """모든 뉴스 소스에서 뉴스 수집"""
         print("Starting news crawling...")
         
-        all_news = []
-        
-        # 각 소스에서 뉴스 수집
-        print("Crawling Naver news...")
-        all_news.extend(self.crawl_naver_news())
-        
-        print("Crawling Hankyung news...")
-        all_news.extend(self.crawl_hankyung_news())
-        
-        print("Crawling MK news...")
-        all_news.extend(self.crawl_mk_news())
-        
-        print("Crawling YNA news...")
-        all_news.extend(self.crawl_yna_news())
-        
-        # 중복 제거
-        print("Removing duplicates...")
-        unique_news = self.remove_duplicates(all_news)
-        
-        # 최신 10개 선택
-        unique_news.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-        self.news_data = unique_news[:10]
+        # 각 소스에서 동시에 수집하여 중복 제거 후 최신 10개 선택 (제한 시간을 넘긴 소스는 건너뜀)
+        self.news_data = self.engine.crawl_sources([self.naver, self.hankyung, self.mk, self.yna], limit=10)
         
         print(f"Collected {len(self.news_data)} unique news items")
+        self.engine.metrics.finish(len(self.news_data))
+        self.engine.report()
         return self.news_data
     
     def save_to_json(self):
@@ -342,6 +104,10 @@ class NewsCrawler:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
         print(f"News data saved to {output_path}")
+        
+        # 실행 지표 보고서 (JSON, Prometheus 텍스트)를 news.json 옆에 저장
+        json_path, _ = self.engine.metrics.write_report(os.path.dirname(output_path))
+        print(f"Crawl metrics saved to {json_path}")
 
 def main():
     crawler = NewsCrawler()
@@ -359,5 +125,9 @@ def main():
         print(f"Error in main: {e}")
         sys.exit(1)
 
+    finally:
+        # 선택자 캐시 저장과 세션 정리
+        crawler.engine.close()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+날짜별 아카이브 결과 캐시
+지난 날짜의 아카이브 페이지는 거의 바뀌지 않으므로, 날짜가 끝난 뒤 수집한 결과를
+날짜별 JSON 파일로 저장해 두고 다음 실행부터는 목록/상세 페이지를 다시 요청하지 않습니다.
+오늘(아직 끝나지 않은 날짜)의 결과는 저장하지 않아 항상 새로 수집합니다.
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime
+
+
+def _as_date(target_date):
+    """datetime 또는 date를 date로 변환"""
+    return target_date.date() if isinstance(target_date, datetime) else target_date
+
+
+class DateArchiveCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def _path(self, target_date):
+        return os.path.join(self.cache_dir, f"{_as_date(target_date).strftime('%Y%m%d')}.json")
+
+    def is_complete(self, target_date, today=None):
+        """날짜가 이미 끝났는지 (오늘 이전 날짜만 캐시 대상)"""
+        return _as_date(target_date) < (today or date.today())
+
+    def has(self, target_date):
+        return os.path.exists(self._path(target_date))
+
+    def get(self, target_date):
+        """캐시된 기사 목록 반환 (없으면 None)"""
+        try:
+            with open(self._path(target_date), 'r', encoding='utf-8') as f:
+                news = json.load(f)['news']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return news
+
+    def put(self, target_date, news_list, today=None):
+        """끝난 날짜의 수집 결과 저장 (오늘 이후 날짜나 빈 결과는 저장하지 않음)
+
+        저장한 날짜는 다시 수집하지 않으므로 모든 목록·상세 페이지를 받은 결과만 저장해야 합니다.
+        """
+        if not news_list or not self.is_complete(target_date, today):
+            return False
+
+        data = {
+            'date': _as_date(target_date).isoformat(),
+            'crawledAt': datetime.now().isoformat(),
+            'news': news_list
+        }
+        path = self._path(target_date)
+        # 동시 실행에서도 깨진 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.stored += 1
+        return True
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'stored': self.stored}
@@ -4,33 +4,67 @@
 오늘과 어제 뉴스를 모두 크롤링하여 더 풍부한 데이터 제공
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
-import time
-import re
 from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
 import os
 import sys
 
+from crawl_engine import BASE_DIR, CrawlEngine, newest_first
+from date_archive_cache import DateArchiveCache
+from frontier import canonicalize_url
+from http_archive import archive_from_env
+from keyword_matcher import KeywordMatcher
+from source_adapters import HankyungEconomyAdapter
+
+# 일일 요약에 표시할 관심 분야별 키워드
+SUMMARY_TOPIC_MATCHER = KeywordMatcher({
+    '부동산': ['부동산', '아파트'],
+    '주식시장': ['주가', '증시', '코스피'],
+    '금리정책': ['금리', '중앙은행'],
+    '경기동향': ['경기', '성장'],
+    '국제정치': ['APEC', '정상회의'],
+    '기업동향': ['삼성', 'LG', 'SK']
+})
+
+MAIN_SECTION_URL = "https://www.hankyung.com/economy"
+
+# 다양한 섹션 URL들
+ADDITIONAL_SECTION_URLS = [
+    "https://www.hankyung.com/realestate",
+    "https://www.hankyung.com/industry",
+    "https://www.hankyung.com/global",
+    "https://www.hankyung.com/politics"
+]
+
 class EnhancedHankyungCrawler:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        # SSL 검증 우회 (개발/테스트 환경에서만)
-        self.session.verify = False
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    def __init__(self, max_workers=8, per_host_concurrency=4, requests_per_second=2.0, use_cache=True, incremental=False, parser_backend=None, link_mode='regex', streaming=False, stream_max_bytes=256 * 1024, pipeline=False, http2=False, archive=None, early_stop=False, sitemaps=False, feeds=False):
+        # 수집·캐시·속도 제한·병렬 처리는 통합 크롤링 엔진이 담당
+        self.engine = CrawlEngine(
+            requests_per_second=requests_per_second,
+            use_cache=use_cache,
+            incremental=incremental,
+            parser_backend=parser_backend,
+            max_workers=max_workers,
+            per_host_concurrency=per_host_concurrency,
+            streaming=streaming,
+            stream_max_bytes=stream_max_bytes,
+            pipeline=pipeline,
+            http2=http2,
+            archive=archive,
+            sitemaps=sitemaps,
+            feeds=feeds
+        )
+        # 한국경제 경제 기사 어댑터 (목록 페이지 링크 추출 방식: 'full', 'strainer', 'regex')
+        self.adapter = HankyungEconomyAdapter(link_mode=link_mode)
+        self.session = self.engine.session
+        # 조기 종료 모드: 목록 페이지를 먼저 모두 받고 기사 번호 순으로 필요한 상세 페이지만 요청
+        self.early_stop = early_stop
         self.news_data = []
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # 지난 날짜의 아카이브 수집 결과는 날짜별로 저장해 두고 재사용
+        self.date_cache = None
+        if use_cache:
+            self.date_cache = DateArchiveCache(os.path.join(self.base_dir, '.cache', 'date_archive'))
         
     def crawl_hankyung_news(self):
         """한국경제신문에서 오늘과 어제 뉴스 크롤링"""
@@ -44,271 +78,196 @@ class EnhancedHankyungCrawler:
             print(f"Today: {today.strftime('%Y-%m-%d')}")
             print(f"Yesterday: {yesterday.strftime('%Y-%m-%d')}")
             
-            all_news = []
-            
-            # 1. 메인 경제 섹션에서 크롤링
-            main_news = self.crawl_main_economy_section()
-            all_news.extend(main_news)
-            
-            # 2. 날짜별 아카이브에서 크롤링
-            today_news = self.crawl_date_archive(today)
-            all_news.extend(today_news)
-            
-            yesterday_news = self.crawl_date_archive(yesterday)
-            all_news.extend(yesterday_news)
-            
-            # 3. 추가 섹션들에서 크롤링
-            additional_news = self.crawl_additional_sections()
-            all_news.extend(additional_news)
-            
-            # 중복 제거 및 정렬
-            unique_news = self.remove_duplicates(all_news)
-            unique_news.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-            
-            # 최대 8개 선택 (오늘 5개 + 어제 3개)
-            self.news_data = unique_news[:8]
+            self.engine.start_run()
+            self.news_data = self.collect_latest_news(today, yesterday)
+            self.engine.metrics.finish(len(self.news_data))
             print(f"Successfully crawled {len(self.news_data)} news items from Hankyung")
+            self.engine.report()
+            if self.date_cache:
+                stats = self.date_cache.stats()
+                print(f"Date archive cache: {stats['hits']} days reused, {stats['misses']} crawled, "
+                      f"{stats['stored']} stored")
             
             return self.news_data
             
         except Exception as e:
             print(f"Error in crawl_hankyung_news: {e}")
             return []
+        
+        finally:
+            self.engine.close()
+    
+    def collect_latest_news(self, today, yesterday):
+        """RSS 피드 → 뉴스 사이트맵 → 목록 페이지 순으로 최신 기사 수집
+        
+        앞 단계에서 얻은 기사가 최대 기사 수보다 적으면 다음 단계에서 나머지를 채웁니다.
+        """
+        max_articles = self.adapter.max_articles
+        
+        # 1. RSS 피드 (피드 수집 모드): 제목·리드 문단·발행시간을 피드에서 바로 사용
+        news = self.select_latest(self.engine.feed_articles(self.adapter))
+        if news:
+            print(f"Collected {len(news)} articles from RSS feeds")
+        if len(news) >= max_articles:
+            return news
+        
+        # 2. 뉴스 사이트맵 (사이트맵 탐색 모드): 충분히 찾으면 목록 페이지는 받지 않음
+        candidates = self.engine.discover_candidates(self.adapter)
+        if candidates:
+            print(f"Discovered {len(candidates)} candidates from news sitemaps")
+            if self.early_stop:
+                news += self.engine.fetch_top_k(self.adapter, candidates, max_articles - len(news))
+            else:
+                news += self.engine.fetch_articles(self.adapter, candidates)
+            news = self.select_latest(news)
+        if len(news) >= max_articles:
+            return news
+        
+        # 3. 목록 페이지
+        if self.early_stop:
+            listing_urls = [MAIN_SECTION_URL]
+            listing_urls += self.archive_urls(today) + self.archive_urls(yesterday)
+            listing_urls += ADDITIONAL_SECTION_URLS
+            news += self.engine.crawl_top_k(self.adapter, listing_urls, max_articles - len(news), timeout=15)
+            return self.select_latest(news)
+        
+        all_news = list(news)
+        
+        # 어제 아카이브 (캐시에 저장되므로 다른 페이지와 겹치는 기사도 빠지지 않도록 먼저 수집)
+        all_news.extend(self.crawl_date_archive(yesterday))
+        
+        # 메인 경제 섹션과 오늘 아카이브
+        all_news.extend(self.crawl_main_economy_section())
+        all_news.extend(self.crawl_date_archive(today))
+        
+        # 추가 섹션들
+        all_news.extend(self.crawl_additional_sections())
+        
+        return self.select_latest(all_news)
+    
+    def select_latest(self, news_list):
+        """중복 제거 후 최신순으로 최대 기사 수만큼 선택"""
+        unique_news = self.remove_duplicates(news_list)
+        unique_news.sort(key=newest_first, reverse=True)
+        
+        # 최대 8개 선택 (오늘 5개 + 어제 3개)
+        return unique_news[:self.adapter.max_articles]
     
     def crawl_main_economy_section(self):
         """메인 경제 섹션에서 뉴스 크롤링"""
         print("Crawling main economy section...")
-        news_items = []
-        
-        try:
-            url = "https://www.hankyung.com/economy"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_items = self.extract_news_from_page(soup, url)
-            
-        except Exception as e:
-            print(f"Error crawling main economy section: {e}")
-        
-        return news_items
+        return self.engine.crawl_listing(self.adapter, MAIN_SECTION_URL, timeout=15)
     
     def crawl_date_archive(self, target_date):
-        """특정 날짜의 아카이브에서 뉴스 크롤링"""
+        """특정 날짜의 아카이브에서 뉴스 크롤링 (지난 날짜는 캐시된 결과 사용)"""
+        if self.date_cache:
+            cached = self.date_cache.get(target_date)
+            if cached is not None:
+                print(f"Using cached archive for {target_date.strftime('%Y-%m-%d')} ({len(cached)} articles)")
+                # 다른 섹션 페이지에서 같은 기사를 다시 요청하지 않도록 프론티어에 등록
+                for item in cached:
+                    self.engine.frontier.add(item['url'])
+                return cached
+        
         print(f"Crawling archive for {target_date.strftime('%Y-%m-%d')}...")
         news_items = []
+        # 받지 못한 목록 페이지와 기사 URL (하나라도 있으면 일부만 수집된 결과)
+        failures = []
+        # 같은 날짜의 여러 목록 페이지에 실린 기사는 한 번만
+        day_urls = set()
         
-        try:
-            # 한국경제 아카이브 URL 패턴
-            date_str = target_date.strftime('%Y%m%d')
-            archive_urls = [
-                f"https://www.hankyung.com/economy?date={date_str}",
-                f"https://www.hankyung.com/stock?date={date_str}",
-                f"https://www.hankyung.com/finance?date={date_str}"
-            ]
-            
-            for url in archive_urls:
-                try:
-                    response = self.session.get(url, timeout=10)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        items = self.extract_news_from_page(soup, url)
-                        news_items.extend(items)
-                    time.sleep(1)
-                except:
+        for url in self.archive_urls(target_date):
+            try:
+                links = self.engine.fetch_listing(self.adapter, url, timeout=10)
+            except Exception as e:
+                print(f"Error crawling {url}: {e}")
+                failures.append(url)
+                continue
+            # 캐시에 저장할 날짜 목록은 프론티어와 무관하게 아카이브 페이지 전체로 구성하고,
+            # 이번 실행에서 이미 수집한 기사(피드·사이트맵·다른 날짜)는 다시 요청하지 않고 재사용
+            candidates = []
+            for full_url, title in self.engine.select_links(self.adapter, links, url):
+                key = canonicalize_url(full_url)
+                if key in day_urls:
                     continue
-                    
-        except Exception as e:
-            print(f"Error crawling date archive: {e}")
+                day_urls.add(key)
+                if self.engine.frontier.add(full_url):
+                    candidates.append((full_url, title))
+                    continue
+                article = self.engine.collected_article(full_url)
+                if article is None:
+                    # 이번 실행에서 요청했지만 실패한 기사
+                    failures.append(full_url)
+                else:
+                    news_items.append(article)
+            news_items.extend(self.engine.fetch_articles(self.adapter, candidates, failed=failures))
+        
+        # 모든 페이지를 받은 끝난 날짜만 저장 (오늘 아카이브나 일부만 수집된 날짜는 다음 실행에서 다시 수집)
+        if self.date_cache:
+            if failures:
+                print(f"Not caching archive for {target_date.strftime('%Y-%m-%d')}: {len(failures)} pages failed")
+            else:
+                self.date_cache.put(target_date, news_items)
         
         return news_items
     
+    def backfill_archive(self, days):
+        """어제부터 days일 전까지 캐시에 없는 날짜의 아카이브를 한 번씩 수집"""
+        if not self.date_cache:
+            print("Backfill requires the date archive cache (use_cache=True)")
+            return 0
+        
+        today = datetime.now()
+        filled = 0
+        for offset in range(1, days + 1):
+            target_date = today - timedelta(days=offset)
+            if self.date_cache.has(target_date):
+                continue
+            self.crawl_date_archive(target_date)
+            if self.date_cache.has(target_date):
+                filled += 1
+        print(f"Backfilled {filled} of {days} past days")
+        return filled
+    
+    def archive_urls(self, target_date):
+        """특정 날짜의 아카이브 목록 페이지 URL"""
+        return self.adapter.archive_urls(target_date)
+    
     def crawl_additional_sections(self):
         """추가 섹션들에서 뉴스 크롤링"""
         print("Crawling additional sections...")
         news_items = []
         
-        # 다양한 섹션 URL들
-        section_urls = [
-            "https://www.hankyung.com/realestate",
-            "https://www.hankyung.com/industry",
-            "https://www.hankyung.com/global",
-            "https://www.hankyung.com/politics"
-        ]
-        
-        for url in section_urls:
-            try:
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    items = self.extract_news_from_page(soup, url)
-                    news_items.extend(items)
-                time.sleep(1)
-            except:
-                continue
+        for url in ADDITIONAL_SECTION_URLS:
+            news_items.extend(self.engine.crawl_listing(self.adapter, url, timeout=10))
         
         return news_items
     
     def extract_news_from_page(self, soup, base_url):
-        """페이지에서 뉴스 추출"""
-        news_items = []
+        """파싱된 페이지에서 뉴스 추출"""
+        links = []
+        for selector in self.adapter.link_selectors:
+            for link in soup.select(selector)[:self.adapter.links_per_selector]:
+                links.append((link.get('href'), link.get_text(strip=True)))
         
-        # 다양한 선택자로 뉴스 링크 찾기
-        selectors = [
-            'a[href*="/article/"]',
-            '.news_list a',
-            '.list_news a',
-            '.article_list a',
-            '.news_item a',
-            '.headline a',
-            '.title a',
-            '.news_title a'
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links[:15]:  # 각 선택자에서 최대 15개
-                try:
-                    href = link.get('href')
-                    if href and '/article/' in href:
-                        title = link.get_text(strip=True)
-                        if title and len(title) > 10 and self.is_economy_related(title):
-                            full_url = urljoin(base_url, href)
-                            
-                            # 상세 내용 크롤링
-                            detail_data = self.crawl_news_detail(full_url, title)
-                            if detail_data:
-                                news_items.append(detail_data)
-                            
-                            time.sleep(0.5)  # 요청 간격 조절
-                            
-                except Exception as e:
-                    continue
-        
-        return news_items
+        candidates = self.engine.select_candidates(self.adapter, links, base_url)
+        return self.engine.fetch_articles(self.adapter, candidates)
     
     def is_economy_related(self, title):
         """경제 관련 뉴스인지 확인"""
-        economy_keywords = [
-            '경제', '금리', '주가', '환율', '부동산', '투자', '금융', '은행',
-            '증권', '펀드', '채권', '코스피', '코스닥', '증시', '시장',
-            '기업', '매출', '수익', '성장', '인플레이션', '물가', '고용',
-            '정부', '정책', '세금', '예산', '국채', '통화', '중앙은행',
-            'GDP', '경기', '회복', '부진', '호황', '침체', '실업',
-            '삼성', 'LG', 'SK', '현대', '기아', '포스코', 'KT', 'SKT',
-            'APEC', '정상회의', '미국', '중국', '일본', '외교', '무역',
-            '원달러', '원화', '달러', '엔화', '유로', '위안'
-        ]
-        
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in economy_keywords)
+        return self.adapter.is_economy_related(title)
     
     def crawl_news_detail(self, url, title):
         """뉴스 상세 내용 크롤링"""
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 본문 추출
-            content_selectors = [
-                '.article-body',
-                '.news-body',
-                '.article_view',
-                '.article-content',
-                '.news-content',
-                '.article_text',
-                '.news_text'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem.get_text(strip=True)
-                    break
-            
-            if not content:
-                content = title  # 본문이 없으면 제목 사용
-            
-            # 발행시간 추출
-            time_selectors = [
-                'time',
-                '.date',
-                '.publish-time',
-                '.article-date',
-                '.news-date',
-                '.byline'
-            ]
-            
-            published_at = datetime.now().isoformat()
-            for selector in time_selectors:
-                time_elem = soup.select_one(selector)
-                if time_elem:
-                    time_text = time_elem.get_text(strip=True)
-                    parsed_time = self.parse_time(time_text)
-                    if parsed_time:
-                        published_at = parsed_time
-                        break
-            
-            return {
-                'title': title,
-                'content': content[:1500],  # 1500자로 제한
-                'url': url,
-                'source': '한국경제',
-                'publishedAt': published_at,
-                'category': '경제'
-            }
-            
-        except Exception as e:
-            print(f"Error crawling detail for {url}: {e}")
-            return None
+        return self.engine.fetch_detail(url, title, self.adapter)
     
     def parse_time(self, time_str):
         """시간 형식 파싱"""
-        try:
-            # 한국 시간 형식들
-            time_patterns = [
-                '%Y-%m-%d %H:%M',
-                '%Y.%m.%d %H:%M',
-                '%Y-%m-%d',
-                '%Y.%m.%d',
-                '%m-%d %H:%M',
-                '%m.%d %H:%M'
-            ]
-            
-            for pattern in time_patterns:
-                try:
-                    parsed_time = datetime.strptime(time_str.strip(), pattern)
-                    # 연도가 없으면 현재 연도로 설정
-                    if parsed_time.year == 1900:
-                        parsed_time = parsed_time.replace(year=datetime.now().year)
-                    return parsed_time.isoformat()
-                except:
-                    continue
-            
-            # 상대적 시간 표현 처리
-            if '시간 전' in time_str or '분 전' in time_str:
-                return datetime.now().isoformat()
-            
-            return None
-            
-        except:
-            return None
+        return self.adapter.parse_time(time_str)
     
     def remove_duplicates(self, news_list):
         """중복 뉴스 제거"""
-        seen_titles = set()
-        unique_news = []
-        
-        for news in news_list:
-            title = news['title'].strip()
-            if title not in seen_titles and len(title) > 10:
-                seen_titles.add(title)
-                unique_news.append(news)
-        
-        return unique_news
+        return self.engine.remove_duplicates(news_list)
     
     def create_daily_summary(self, news_list):
         """오늘의 경제 이슈 요약 생성"""
@@ -320,24 +279,8 @@ class EnhancedHankyungCrawler:
         
         summary_parts = []
         
-        # 주요 키워드 추출
-        keywords = []
-        for title in titles:
-            if '부동산' in title or '아파트' in title:
-                keywords.append('부동산')
-            if '주가' in title or '증시' in title or '코스피' in title:
-                keywords.append('주식시장')
-            if '금리' in title or '중앙은행' in title:
-                keywords.append('금리정책')
-            if '경기' in title or '성장' in title:
-                keywords.append('경기동향')
-            if 'APEC' in title or '정상회의' in title:
-                keywords.append('국제정치')
-            if '삼성' in title or 'LG' in title or 'SK' in title:
-                keywords.append('기업동향')
-        
-        # 중복 제거
-        unique_keywords = list(set(keywords))
+        # 주요 키워드 추출 (모든 제목을 한 번에 훑어 등장 순서대로)
+        unique_keywords = SUMMARY_TOPIC_MATCHER.categories('\n'.join(titles))
         
         if unique_keywords:
             summary_parts.append(f"📈 **오늘의 주요 경제 이슈**")
@@ -374,6 +317,10 @@ class EnhancedHankyungCrawler:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
         print(f"News data saved to {output_path}")
+        
+        # 실행 지표 보고서 (JSON, Prometheus 텍스트)를 news.json 옆에 저장
+        json_path, _ = self.engine.metrics.write_report(os.path.dirname(output_path))
+        print(f"Crawl metrics saved to {json_path}")
     
     def create_fallback_data(self):
         """폴백 데이터 생성 (오늘 + 어제 뉴스)"""
@@ -454,9 +401,32 @@ class EnhancedHankyungCrawler:
         print("Enhanced fallback data created successfully!")
 
 def main():
-    crawler = EnhancedHankyungCrawler()
+    # CRAWL_INCREMENTAL=1 이면 이전 실행에서 수집한 기사는 다시 요청하지 않음
+    # CRAWL_STREAMING=1 이면 기사 본문을 스트리밍으로 필요한 만큼만 내려받음
+    # CRAWL_PIPELINE=1 이면 수집(스레드)과 파싱(프로세스 풀)을 분리
+    # CRAWL_HTTP2=1 이면 HTTPS 요청을 HTTP/2로 전송 (httpx[http2] 필요)
+    # CRAWL_ARCHIVE=record 이면 받은 응답을 녹화, replay 이면 녹화된 응답으로 오프라인 실행
+    # CRAWL_EARLY_STOP=1 이면 기사 번호로 최신 후보를 골라 상위 기사 수만큼만 상세 요청
+    # CRAWL_SITEMAPS=1 이면 robots.txt의 뉴스 사이트맵으로 기사를 찾고, 없으면 목록 페이지 사용
+    # CRAWL_FEEDS=1 이면 RSS 피드로 기사를 만들고, 피드에 본문이 없는 기사만 상세 요청
+    # CRAWL_BACKFILL_DAYS=N 이면 크롤링 전에 지난 N일의 아카이브를 날짜별 캐시에 채움
+    crawler = EnhancedHankyungCrawler(
+        incremental=os.getenv('CRAWL_INCREMENTAL') == '1',
+        streaming=os.getenv('CRAWL_STREAMING') == '1',
+        pipeline=os.getenv('CRAWL_PIPELINE') == '1',
+        http2=os.getenv('CRAWL_HTTP2') == '1',
+        archive=archive_from_env(BASE_DIR),
+        early_stop=os.getenv('CRAWL_EARLY_STOP') == '1',
+        sitemaps=os.getenv('CRAWL_SITEMAPS') == '1',
+        feeds=os.getenv('CRAWL_FEEDS') == '1'
+    )
     
     try:
+        backfill_days = int(os.getenv('CRAWL_BACKFILL_DAYS') or 0)
+        if backfill_days:
+            crawler.engine.start_run()
+            crawler.backfill_archive(backfill_days)
+        
         # 뉴스 크롤링
         news_data = crawler.crawl_hankyung_news()
         
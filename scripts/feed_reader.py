@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+RSS/Atom 피드 수집기
+언론사 경제 섹션 피드에서 기사 제목, 링크, 발행시간, 리드 문단을 읽어
+목록 페이지와 기사 페이지를 내려받지 않고도 기사 데이터를 만들 수 있게 합니다.
+피드 요청은 세션의 HTTP 캐시를 거치므로 바뀌지 않은 피드는 조건부 GET(304)으로 확인만 합니다.
+스트리밍 요청은 캐시를 건너뛰므로 피드 본문은 한 번에 받고, 파싱만 항목 단위로 하여 max_items에서 멈춥니다.
+"""
+
+import html
+import re
+import threading
+from collections import namedtuple
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from time_parser import KST, parse_time
+
+FeedItem = namedtuple('FeedItem', ['url', 'title', 'published_at', 'summary'])
+
+TAG_RE = re.compile(r'<[^>]+>')
+SPACE_RE = re.compile(r'\s+')
+
+
+def _local_name(tag):
+    """'{네임스페이스}이름' 태그에서 이름만 반환"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def strip_html(text):
+    """피드 설명의 HTML 태그와 엔티티를 제거한 텍스트"""
+    if not text:
+        return ''
+    return SPACE_RE.sub(' ', html.unescape(TAG_RE.sub(' ', text))).strip()
+
+
+def parse_feed_time(text):
+    """RSS(RFC 822) 또는 Atom(ISO 8601) 날짜를 KST ISO 문자열로 변환"""
+    if not text:
+        return None
+    try:
+        parsed = parsedate_to_datetime(text.strip())
+    except (TypeError, ValueError, IndexError):
+        return parse_time(text)
+    if parsed is None:
+        return parse_time(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=KST)
+    return parsed.astimezone(KST).isoformat()
+
+
+def _item_from_element(elem):
+    """<item>(RSS) 또는 <entry>(Atom) 요소를 FeedItem으로 변환"""
+    fields = {}
+    link = None
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == 'link':
+            # Atom은 href 속성 (rel이 없거나 alternate인 링크), RSS는 텍스트
+            if child.get('href') and child.get('rel', 'alternate') == 'alternate':
+                link = link or child.get('href')
+            elif child.text and child.text.strip():
+                link = link or child.text.strip()
+        elif child.text and name not in fields:
+            fields[name] = child.text
+
+    # RSS의 guid가 URL인 경우 링크 대신 사용
+    if not link and (fields.get('guid') or '').startswith('http'):
+        link = fields['guid'].strip()
+
+    published = fields.get('pubDate') or fields.get('published') or fields.get('date') or fields.get('updated')
+    summary = fields.get('description') or fields.get('summary') or fields.get('encoded') or fields.get('content')
+    return FeedItem(link, strip_html(fields.get('title')), parse_feed_time(published), strip_html(summary))
+
+
+def iter_feed(chunks):
+    """피드 XML 바이트 조각을 받으면서 FeedItem을 차례로 생성
+
+    <item>/<entry> 요소가 끝날 때마다 항목을 내보내고 요소를 비웁니다.
+    """
+    parser = XMLPullParser(events=('end',))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _read_items(parser)
+    parser.close()
+    yield from _read_items(parser)
+
+
+def _read_items(parser):
+    for _, elem in parser.read_events():
+        if _local_name(elem.tag) in ('item', 'entry'):
+            item = _item_from_element(elem)
+            if item.url:
+                yield item
+            elem.clear()
+
+
+class FeedReader:
+    def __init__(self, session, max_items=100):
+        self.session = session
+        # 피드 하나에서 읽을 최대 기사 수
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.items = 0
+        self.errors = 0
+
+    def _count(self, requests=0, not_modified=0, items=0, errors=0):
+        with self._lock:
+            self.requests += requests
+            self.not_modified += not_modified
+            self.items += items
+            self.errors += errors
+
+    def read(self, url):
+        """피드 하나의 기사 항목 목록 (오류 시 빈 목록)"""
+        items = []
+        self._count(requests=1)
+        try:
+            # 스트리밍 요청은 HTTP 캐시를 건너뛰므로 일반 요청으로 본문 전체를 받아 조건부 GET을 사용
+            response = self.session.get(url)
+            response.raise_for_status()
+            if getattr(response, 'from_cache', False):
+                self._count(not_modified=1)
+            for item in iter_feed([response.content]):
+                items.append(item)
+                if len(items) >= self.max_items:
+                    break
+        except ParseError as e:
+            self._count(errors=1)
+            print(f"Invalid feed {url}: {e}")
+        except Exception as e:
+            self._count(errors=1)
+            print(f"Error reading feed {url}: {e}")
+
+        self._count(items=len(items))
+        return items
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'not_modified': self.not_modified,
+            'items': self.items,
+            'errors': self.errors
+        }
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 가상 뉴스 페이지 생성기
+한국경제 섹션/기사 페이지와 비슷한 구조(광고, 스크립트, 관련 기사 위젯 포함)의 HTML을 만듭니다.
+"""
+
+import random
+
+TITLE_WORDS = [
+    '코스피', '금리', '환율', '부동산', '삼성전자', '반도체', '한국은행', '물가',
+    '수출', '증시', '투자', '채권', '원달러', '기업', '실적', '정부', '정책', '경기'
+]
+BODY_WORDS = [
+    '시장', '전문가들은', '이번', '발표에', '따라', '상승세를', '이어갈', '것으로',
+    '전망했다', '외국인', '투자자들의', '순매수가', '지속되면서', '지수는', '전일', '대비'
+]
+
+
+def make_title(rng, index):
+    """기사 제목 생성"""
+    words = rng.sample(TITLE_WORDS, 4)
+    return f"{words[0]} {words[1]} {index}번째 소식, {words[2]}·{words[3]} 영향"
+
+
+def make_paragraph(rng, words=60):
+    """본문 문단 생성"""
+    return ' '.join(rng.choice(BODY_WORDS) for _ in range(words)) + '.'
+
+
+def filler(rng, blocks):
+    """광고·스크립트·위젯 등 본문과 무관한 마크업"""
+    parts = []
+    for i in range(blocks):
+        parts.append(f'<div class="ad ad-{i}"><script>var slot{i} = {{"id": {i}, "size": [300, 250]}};</script>'
+                     f'<iframe src="https://ads.example.com/{i}"></iframe></div>')
+        parts.append('<ul class="related">' + ''.join(
+            f'<li><a href="/tag/{rng.randint(1, 999)}"><img src="/img/{j}.jpg" alt="">관련 키워드 {j}</a></li>'
+            for j in range(8)
+        ) + '</ul>')
+    return '\n'.join(parts)
+
+
+def article_url(base_url, index, date_str='20241018'):
+    """한국경제 형식의 기사 URL"""
+    return f"{base_url}/article/{date_str}{index:05d}i"
+
+
+def make_section_page(links=60, base_url='https://www.hankyung.com', filler_blocks=40, seed=0,
+                      date_str='20241018', urls=None, list_class='news_list', title_prefix='',
+                      site_name='한국경제'):
+    """기사 링크 목록이 있는 섹션 페이지 (urls를 주면 한국경제 형식 대신 해당 기사 URL 사용)"""
+    rng = random.Random(seed)
+    urls = urls or [article_url(base_url, i, date_str) for i in range(links)]
+    items = []
+    for i, url in enumerate(urls):
+        title = title_prefix + make_title(rng, i)
+        items.append(
+            f'<li class="news_item"><div class="thumb"><a href="{url}"><img src="/thumb/{i}.jpg"></a></div>'
+            f'<h3 class="news_title"><a href="{url}">{title}</a></h3>'
+            f'<p class="lead">{make_paragraph(rng, 20)}</p>'
+            f'<span class="date">2024.10.18 {9 + i % 12:02d}:{i % 60:02d}</span></li>'
+        )
+    return (
+        f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>경제 - {site_name}</title>'
+        '<script src="/js/app.js"></script></head><body>'
+        f'<header>{filler(rng, 2)}</header>'
+        f'<div class="headline"><a href="{urls[0]}">{title_prefix}{make_title(rng, 0)}</a></div>'
+        f'<ul class="{list_class}">{"".join(items)}</ul>'
+        f'<aside>{filler(rng, filler_blocks)}</aside>'
+        '</body></html>'
+    )
+
+
+def make_article_page(title='코스피 3일 연속 상승', paragraphs=12, filler_blocks=30, seed=0,
+                      published='2024.10.18 09:30', body_class='article-body', body_id='articletxt',
+                      time_class='date', site_name='한국경제'):
+    """본문과 발행시간이 있는 기사 페이지 (본문·시간 요소의 class는 사이트별로 지정)"""
+    rng = random.Random(seed)
+    body = ''.join(f'<p>{make_paragraph(rng)}</p>' for _ in range(paragraphs))
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        f'<title>{title} - {site_name}</title><script src="/js/article.js"></script></head><body>'
+        f'<header>{filler(rng, 2)}</header>'
+        f'<h1 class="headline">{title}</h1>'
+        f'<div class="article-info"><span class="{time_class}">{published}</span></div>'
+        f'<div class="{body_class}" id="{body_id}">{body}</div>'
+        f'<aside>{filler(rng, filler_blocks)}</aside>'
+        '</body></html>'
+    )
+
+
+def make_news_sitemap(urls, seed=0, date_str='2024-10-18', publication_name='한국경제'):
+    """뉴스 사이트맵 XML (기사 URL, 제목, 발행시간; 앞쪽 URL일수록 최신)"""
+    rng = random.Random(seed)
+    entries = []
+    for i, url in enumerate(urls):
+        minutes = (23 * 60 + 59 - i * 5) % (24 * 60)
+        entries.append(
+            f'<url><loc>{url}</loc><news:news>'
+            f'<news:publication><news:name>{publication_name}</news:name><news:language>ko</news:language></news:publication>'
+            f'<news:publication_date>{date_str}T{minutes // 60:02d}:{minutes % 60:02d}:00+09:00</news:publication_date>'
+            f'<news:title>{make_title(rng, i)}</news:title></news:news></url>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">'
+        f'{"".join(entries)}</urlset>'
+    )
+
+
+def make_rss_feed(urls, seed=0, date_str='Fri, 18 Oct 2024', site_name='한국경제', summary_every=4):
+    """RSS 2.0 피드 XML (앞쪽 URL일수록 최신, summary_every번째 기사마다 설명 없음)"""
+    rng = random.Random(seed)
+    items = []
+    for i, url in enumerate(urls):
+        minutes = (23 * 60 + 59 - i * 5) % (24 * 60)
+        description = ''
+        if not summary_every or (i + 1) % summary_every:
+            description = f'<description><![CDATA[<p>{make_paragraph(rng, 30)}</p>]]></description>'
+        items.append(
+            f'<item><title>{make_title(rng, i)}</title><link>{url}</link>'
+            f'<pubDate>{date_str} {minutes // 60:02d}:{minutes % 60:02d}:00 +0900</pubDate>'
+            f'{description}</item>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f'<title>{site_name} 경제</title><link>https://example.com/</link>'
+        f'{"".join(items)}</channel></rss>'
+    )
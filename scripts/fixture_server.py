@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+가상 뉴스 사이트 서버
+한국경제, 네이버뉴스, 매일경제, 연합뉴스의 섹션/기사 페이지를 흉내 내는 로컬 HTTP 서버입니다.
+섹션당 기사 수, 페이지 크기, 응답 지연, 오류 비율을 조절할 수 있어
+크롤러 부하 테스트와 처리량 벤치마크에 사용합니다.
+요청 사이트는 Host 헤더로 구분하므로 CrawlSession.host_overrides로 실제 호스트를 이 서버로 연결합니다.
+/robots.txt 와 /sitemap-news.xml 은 기사 URL·제목·발행시간이 담긴 뉴스 사이트맵을,
+/feed/*, /rss/* 는 ETag가 붙은 RSS 피드를 제공합니다 (If-None-Match가 같으면 304).
+/__stats__ 는 요청 통계를 JSON으로 돌려주고, /__reset__ 은 통계를 초기화합니다.
+
+사용법:
+    python scripts/fixture_server.py [--port 8800] [--articles 60] [--latency 0.05] [--error-rate 0.02]
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fixture_pages import make_article_page, make_news_sitemap, make_rss_feed, make_section_page
+
+# 호스트별 사이트 구성: 기사 URL 형식과 기사 페이지의 본문/시간 요소 class
+SITES = {
+    'www.hankyung.com': {
+        'name': '한국경제',
+        'article_url': 'https://www.hankyung.com/article/20241018{index:05d}i',
+        'body_class': 'article-body',
+        'time_class': 'date',
+    },
+    'news.naver.com': {
+        'name': '네이버뉴스',
+        'article_url': 'https://n.news.naver.com/mnews/article/101/{index:010d}',
+        # 네이버 크롤러는 .cluster_group 목록과 제목의 '경제'로 기사를 고름
+        'list_class': 'cluster_group',
+        'title_prefix': '[경제] ',
+    },
+    'n.news.naver.com': {
+        'name': '네이버뉴스',
+        'body_class': 'news_end_body',
+        'body_id': 'newsct_article',
+        'time_class': 't11',
+    },
+    'www.mk.co.kr': {
+        'name': '매일경제',
+        'article_url': 'https://www.mk.co.kr/news/economy/view/{index:08d}',
+        'body_class': 'news_cnt_detail_wrap',
+        'time_class': 'time',
+    },
+    'www.yna.co.kr': {
+        'name': '연합뉴스',
+        'article_url': 'https://www.yna.co.kr/economy/view/AKR20241018{index:06d}',
+        'body_class': 'story-news',
+        'time_class': 'publish-time',
+    },
+}
+
+FEED_PATH_RE = re.compile(r'^/(?:feed|rss)/')
+ARTICLE_PATH_RE = re.compile(r'/(?:article/|mnews/article/|news/economy/view/|economy/view/)')
+
+
+class FixtureNewsServer:
+    def __init__(self, host='127.0.0.1', port=0, articles=60, paragraphs=12, filler_blocks=30,
+                 latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+        self.articles = articles
+        self.paragraphs = paragraphs
+        # 광고·위젯 마크업 블록 수 (페이지 크기 조절)
+        self.filler_blocks = filler_blocks
+        self.latency = latency
+        self.jitter = jitter
+        # 이 비율만큼 503 응답
+        self.error_rate = error_rate
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def host_overrides(self):
+        """CrawlSession.host_overrides에 넣을 {실제 호스트: 이 서버} 매핑"""
+        return {host: self.url for host in SITES}
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = 0
+            self.listing_pages = 0
+            self.article_pages = 0
+            self.sitemap_pages = 0
+            self.feed_pages = 0
+            self.not_modified = 0
+            self.errors = 0
+            self.bytes_sent = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'listing_pages': self.listing_pages,
+                'article_pages': self.article_pages,
+                'sitemap_pages': self.sitemap_pages,
+                'feed_pages': self.feed_pages,
+                'not_modified': self.not_modified,
+                'errors': self.errors,
+                'bytes_sent': self.bytes_sent
+            }
+
+    def render(self, host, path):
+        """요청 경로에 해당하는 (본문, 종류: 'listing' | 'article' | 'sitemap' | 'feed', Content-Type)"""
+        site = SITES.get(host, SITES['www.hankyung.com'])
+        # 같은 경로는 항상 같은 페이지 (재요청·캐시 테스트가 가능하도록)
+        seed = zlib.crc32(f'{self.seed}:{host}{path}'.encode('utf-8'))
+
+        if path == '/robots.txt':
+            robots = 'User-agent: *\nAllow: /\n'
+            if 'article_url' in site:
+                robots += f'Sitemap: https://{host}/sitemap-news.xml\n'
+            return robots, 'sitemap', 'text/plain; charset=utf-8'
+
+        if path == '/sitemap-news.xml' and 'article_url' in site:
+            # 섹션 페이지와 겹치지 않는 번호 구간, 번호가 클수록 최신
+            urls = [site['article_url'].format(index=99999 - i) for i in range(self.articles)]
+            return make_news_sitemap(urls, seed, publication_name=site['name']), 'sitemap', 'application/xml'
+
+        if FEED_PATH_RE.search(path) and 'article_url' in site:
+            # 사이트맵과 겹치지 않는 번호 구간
+            urls = [site['article_url'].format(index=89999 - i) for i in range(self.articles)]
+            return make_rss_feed(urls, seed, site_name=site['name']), 'feed', 'application/rss+xml; charset=utf-8'
+
+        if ARTICLE_PATH_RE.search(path):
+            page = make_article_page(
+                title='기사', paragraphs=self.paragraphs, filler_blocks=self.filler_blocks, seed=seed,
+                published=f'2024.10.18 {seed % 24:02d}:{seed % 60:02d}',
+                body_class=site.get('body_class', 'article-body'), body_id=site.get('body_id', 'articletxt'),
+                time_class=site.get('time_class', 'date'), site_name=site['name']
+            )
+            return page, 'article', 'text/html; charset=utf-8'
+
+        # 섹션마다 다른 기사 번호 구간을 사용
+        offset = (seed % 1000) * self.articles
+        urls = [site['article_url'].format(index=offset + i) for i in range(self.articles)]
+        page = make_section_page(
+            filler_blocks=self.filler_blocks, seed=seed, urls=urls,
+            list_class=site.get('list_class', 'news_list'), title_prefix=site.get('title_prefix', ''),
+            site_name=site['name']
+        )
+        return page, 'listing', 'text/html; charset=utf-8'
+
+    def handle(self, request):
+        """요청 처리: 지연 → (확률적으로) 503 → 페이지 응답"""
+        if request.path in ('/__stats__', '/__reset__'):
+            if request.path == '/__reset__':
+                self.reset_stats()
+            self.send(request, json.dumps(self.stats()).encode('utf-8'), 'application/json')
+            return
+
+        host = (request.headers.get('Host') or '').split(':')[0]
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if failed:
+            with self._lock:
+                self.errors += 1
+            request.send_response(503)
+            request.send_header('Content-Length', '0')
+            request.end_headers()
+            return
+
+        page, kind, content_type = self.render(host, request.path)
+        body = page.encode('utf-8')
+
+        if kind == 'feed':
+            etag = f'"{zlib.crc32(body):08x}"'
+            if request.headers.get('If-None-Match') == etag:
+                with self._lock:
+                    self.not_modified += 1
+                request.send_response(304)
+                request.send_header('ETag', etag)
+                request.send_header('Content-Length', '0')
+                request.end_headers()
+                return
+            with self._lock:
+                self.feed_pages += 1
+                self.bytes_sent += len(body)
+            self.send(request, body, content_type, {'ETag': etag})
+            return
+
+        with self._lock:
+            if kind == 'article':
+                self.article_pages += 1
+            elif kind == 'sitemap':
+                self.sitemap_pages += 1
+            else:
+                self.listing_pages += 1
+            self.bytes_sent += len(body)
+        self.send(request, body, content_type)
+
+    def send(self, request, body, content_type='text/html; charset=utf-8', headers=None):
+        request.send_response(200)
+        request.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local fixture news-site server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--articles', type=int, default=60, help='article links per section page')
+    parser.add_argument('--paragraphs', type=int, default=12, help='paragraphs per article')
+    parser.add_argument('--filler', type=int, default=30, help='ad/widget blocks per page (page size)')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds before each response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random +/- seconds added to latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    args = parser.parse_args()
+
+    server = FixtureNewsServer(
+        args.host, args.port, articles=args.articles, paragraphs=args.paragraphs, filler_blocks=args.filler,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    )
+    print(f"Serving fixture news sites on {server.url} for: {', '.join(SITES)}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+크롤 프론티어
+상세 페이지 요청 전에 URL을 정규화하고 중복을 걸러내어 같은 기사를 두 번 가져오지 않게 합니다.
+"""
+
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'from'}
+TRACKING_PREFIXES = ('utm_',)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url):
+    """URL 정규화 (스킴/호스트 소문자, 기본 포트·프래그먼트·추적 파라미터 제거, 쿼리 정렬)"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class CrawlFrontier:
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.added = 0
+        self.skipped = 0
+
+    def add(self, url):
+        """처음 보는 URL이면 정규화된 URL 반환, 이미 본 URL이면 None"""
+        canonical = canonicalize_url(url)
+        with self._lock:
+            if canonical in self._seen:
+                self.skipped += 1
+                return None
+            self._seen.add(canonical)
+            self.added += 1
+            return canonical
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+    def stats(self):
+        """프론티어 통계 (등록된 URL 수, 중복으로 생략된 요청 수)"""
+        return {'added': self.added, 'skipped': self.skipped}
@@ -4,209 +4,124 @@
 한국경제에서 5개의 최신 경제 뉴스를 크롤링합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
-import time
-import re
-from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
+from datetime import datetime
 import os
 import sys
 
+from crawl_engine import CrawlEngine
+from keyword_matcher import KeywordMatcher
+from source_adapters import HankyungEconomyAdapter
+from time_parser import now_iso
+
+# 일일 요약에 표시할 관심 분야별 키워드
+SUMMARY_TOPIC_MATCHER = KeywordMatcher({
+    '부동산': ['부동산', '아파트'],
+    '주식시장': ['주가', '증시', '코스피'],
+    '금리정책': ['금리', '중앙은행'],
+    '경기동향': ['경기', '성장'],
+    '국제정치': ['APEC', '정상회의']
+})
+
+# 경제 관련 뉴스 판별 키워드
+ECONOMY_KEYWORDS = [
+    '경제', '금리', '주가', '환율', '부동산', '투자', '금융', '은행',
+    '증권', '펀드', '채권', '코스피', '코스닥', '증시', '시장',
+    '기업', '매출', '수익', '성장', '인플레이션', '물가', '고용',
+    '정부', '정책', '세금', '예산', '국채', '통화', '중앙은행'
+]
+
 class HankyungCrawler:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        # SSL 검증 우회 (개발/테스트 환경에서만)
-        self.session.verify = False
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    def __init__(self, requests_per_second=1.0, use_cache=True, incremental=False, parser_backend=None):
+        # 속도 제한, 캐시, 증분 저장소, URL 프론티어는 공통 크롤링 엔진이 관리
+        self.engine = CrawlEngine(
+            requests_per_second=requests_per_second,
+            use_cache=use_cache,
+            incremental=incremental,
+            parser_backend=parser_backend
+        )
+        self.adapter = HankyungEconomyAdapter(
+            listing_urls=[
+                "https://www.hankyung.com/economy",
+                "https://www.hankyung.com/stock",
+                "https://www.hankyung.com/finance"
+            ],
+            link_selectors=[
+                'a[href*="/article/"]',
+                '.news_list a',
+                '.list_news a',
+                '.article_list a',
+                '.news_item a',
+                '.headline a'
+            ],
+            links_per_selector=10,
+            content_selectors=[
+                '.article-body',
+                '.news-body',
+                '.article_view',
+                '.article-content',
+                '.news-content'
+            ],
+            time_selectors=[
+                'time',
+                '.date',
+                '.publish-time',
+                '.article-date',
+                '.news-date'
+            ],
+            economy_keywords=ECONOMY_KEYWORDS,
+            content_limit=1000,
+            max_articles=5
+        )
+        self.session = self.engine.session
         self.news_data = []
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.base_dir = self.engine.base_dir
         
     def crawl_hankyung_news(self):
         """한국경제신문에서 경제 뉴스 크롤링"""
         try:
             print("Starting Hankyung news crawling...")
             
-            # 한국경제 경제 섹션 URL들
-            urls = [
-                "https://www.hankyung.com/economy",
-                "https://www.hankyung.com/stock",
-                "https://www.hankyung.com/finance"
-            ]
-            
-            all_news = []
-            
-            for url in urls:
-                print(f"Crawling: {url}")
-                try:
-                    response = self.session.get(url, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    news_items = self.extract_news_from_page(soup, url)
-                    all_news.extend(news_items)
-                    
-                    time.sleep(2)  # 요청 간격 조절
-                    
-                except Exception as e:
-                    print(f"Error crawling {url}: {e}")
-                    continue
+            self.engine.start_run()
             
-            # 중복 제거 및 정렬
-            unique_news = self.remove_duplicates(all_news)
-            unique_news.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-            
-            # 최대 5개 선택
-            self.news_data = unique_news[:5]
+            # 경제/증권/금융 섹션 수집, 중복 제거 및 정렬 후 최대 5개 선택
+            self.news_data = self.engine.crawl_source(self.adapter)
+            self.engine.metrics.finish(len(self.news_data))
             print(f"Successfully crawled {len(self.news_data)} news items from Hankyung")
+            self.engine.report()
             
             return self.news_data
             
         except Exception as e:
             print(f"Error in crawl_hankyung_news: {e}")
             return []
+        finally:
+            self.engine.close()
     
     def extract_news_from_page(self, soup, base_url):
         """페이지에서 뉴스 추출"""
-        news_items = []
-        
-        # 다양한 선택자로 뉴스 링크 찾기
-        selectors = [
-            'a[href*="/article/"]',
-            '.news_list a',
-            '.list_news a',
-            '.article_list a',
-            '.news_item a',
-            '.headline a'
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links[:10]:  # 각 선택자에서 최대 10개
-                try:
-                    href = link.get('href')
-                    if href and '/article/' in href:
-                        title = link.get_text(strip=True)
-                        if title and len(title) > 10 and self.is_economy_related(title):
-                            full_url = urljoin(base_url, href)
-                            
-                            # 상세 내용 크롤링
-                            detail_data = self.crawl_news_detail(full_url, title)
-                            if detail_data:
-                                news_items.append(detail_data)
-                            
-                            time.sleep(1)  # 요청 간격 조절
-                            
-                except Exception as e:
-                    print(f"Error processing link: {e}")
-                    continue
-        
-        return news_items
+        links = []
+        for selector in self.adapter.link_selectors:
+            for link in soup.select(selector)[:self.adapter.links_per_selector]:
+                links.append((link.get('href'), link.get_text(strip=True)))
+        candidates = self.engine.select_candidates(self.adapter, links, base_url)
+        return self.engine.fetch_articles(self.adapter, candidates)
     
     def is_economy_related(self, title):
         """경제 관련 뉴스인지 확인"""
-        economy_keywords = [
-            '경제', '금리', '주가', '환율', '부동산', '투자', '금융', '은행',
-            '증권', '펀드', '채권', '코스피', '코스닥', '증시', '시장',
-            '기업', '매출', '수익', '성장', '인플레이션', '물가', '고용',
-            '정부', '정책', '세금', '예산', '국채', '통화', '중앙은행'
-        ]
-        
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in economy_keywords)
+        return self.adapter.is_economy_related(title)
     
     def crawl_news_detail(self, url, title):
         """뉴스 상세 내용 크롤링"""
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 본문 추출
-            content_selectors = [
-                '.article-body',
-                '.news-body',
-                '.article_view',
-                '.article-content',
-                '.news-content'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem.get_text(strip=True)
-                    break
-            
-            if not content:
-                content = title  # 본문이 없으면 제목 사용
-            
-            # 발행시간 추출
-            time_selectors = [
-                'time',
-                '.date',
-                '.publish-time',
-                '.article-date',
-                '.news-date'
-            ]
-            
-            published_at = datetime.now().isoformat()
-            for selector in time_selectors:
-                time_elem = soup.select_one(selector)
-                if time_elem:
-                    time_text = time_elem.get_text(strip=True)
-                    published_at = self.parse_time(time_text)
-                    break
-            
-            return {
-                'title': title,
-                'content': content[:1000],  # 1000자로 제한
-                'url': url,
-                'source': '한국경제',
-                'publishedAt': published_at,
-                'category': '경제'
-            }
-            
-        except Exception as e:
-            print(f"Error crawling detail for {url}: {e}")
-            return None
+        return self.engine.fetch_detail(url, title, self.adapter)
     
     def parse_time(self, time_str):
         """시간 형식 파싱"""
-        try:
-            # 한국 시간 형식인 경우
-            if re.match(r'\d{4}-\d{2}-\d{2}', time_str):
-                return datetime.strptime(time_str, '%Y-%m-%d').isoformat()
-            elif re.match(r'\d{4}.\d{2}.\d{2}', time_str):
-                return datetime.strptime(time_str, '%Y.%m.%d').isoformat()
-            else:
-                return datetime.now().isoformat()
-        except:
-            return datetime.now().isoformat()
+        return self.adapter.parse_time(time_str) or now_iso()
     
     def remove_duplicates(self, news_list):
         """중복 뉴스 제거"""
-        seen_titles = set()
-        unique_news = []
-        
-        for news in news_list:
-            title = news['title'].strip()
-            if title not in seen_titles and len(title) > 10:
-                seen_titles.add(title)
-                unique_news.append(news)
-        
-        return unique_news
+        return self.engine.remove_duplicates(news_list)
     
     def create_daily_summary(self, news_list):
         """오늘의 경제 이슈 요약 생성"""
@@ -218,22 +133,8 @@ class HankyungCrawler:
         
         summary_parts = []
         
-        # 주요 키워드 추출
-        keywords = []
-        for title in titles:
-            if '부동산' in title or '아파트' in title:
-                keywords.append('부동산')
-            if '주가' in title or '증시' in title or '코스피' in title:
-                keywords.append('주식시장')
-            if '금리' in title or '중앙은행' in title:
-                keywords.append('금리정책')
-            if '경기' in title or '성장' in title:
-                keywords.append('경기동향')
-            if 'APEC' in title or '정상회의' in title:
-                keywords.append('국제정치')
-        
-        # 중복 제거
-        unique_keywords = list(set(keywords))
+        # 주요 키워드 추출 (모든 제목을 한 번에 훑어 등장 순서대로)
+        unique_keywords = SUMMARY_TOPIC_MATCHER.categories('\n'.join(titles))
         
         if unique_keywords:
             summary_parts.append(f"오늘의 주요 경제 이슈는 {', '.join(unique_keywords)} 관련 뉴스가 주목받고 있습니다.")
@@ -266,6 +167,10 @@ class HankyungCrawler:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
         print(f"News data saved to {output_path}")
+        
+        # 실행 지표 보고서 (JSON, Prometheus 텍스트)를 news.json 옆에 저장
+        json_path, _ = self.engine.metrics.write_report(os.path.dirname(output_path))
+        print(f"Crawl metrics saved to {json_path}")
     
     def create_fallback_data(self):
         """폴백 데이터 생성"""
@@ -317,7 +222,8 @@ class HankyungCrawler:
         print("Fallback data created successfully!")
 
 def main():
-    crawler = HankyungCrawler()
+    # CRAWL_INCREMENTAL=1 이면 이전 실행에서 수집한 기사는 다시 요청하지 않음
+    crawler = HankyungCrawler(incremental=os.getenv('CRAWL_INCREMENTAL') == '1')
     
     try:
         # 뉴스 크롤링
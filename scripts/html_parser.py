@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 선택기
+html.parser, lxml, selectolax(lexbor) 중 사용 가능한 가장 빠른 백엔드로 HTML을 파싱합니다.
+모든 백엔드는 크롤러가 사용하는 BeautifulSoup 인터페이스
+(select, select_one, find, find_all, get, get_text)를 제공합니다.
+"""
+
+import os
+
+from bs4 import BeautifulSoup, UnicodeDammit
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# 빠른 순서
+BACKEND_PRIORITY = ['selectolax', 'lxml', 'html.parser']
+
+
+def available_backends():
+    """현재 환경에서 사용 가능한 백엔드 목록 (빠른 순)"""
+    available = {
+        'selectolax': HAS_SELECTOLAX,
+        'lxml': HAS_LXML,
+        'html.parser': True
+    }
+    return [name for name in BACKEND_PRIORITY if available[name]]
+
+
+def default_backend():
+    """기본 백엔드 (CRAWL_HTML_PARSER 환경변수 우선, 없으면 가장 빠른 백엔드)"""
+    requested = os.getenv('CRAWL_HTML_PARSER')
+    backends = available_backends()
+    if requested in backends:
+        return requested
+    return backends[0]
+
+
+def decode_html(content):
+    """바이트 HTML을 문자열로 변환 (UTF-8 우선, 실패 시 인코딩 추정)"""
+    if isinstance(content, str):
+        return content
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return UnicodeDammit(content, is_html=True).unicode_markup
+
+
+def parse_html(content, backend=None):
+    """지정한 (또는 기본) 백엔드로 HTML 파싱"""
+    backend = backend or default_backend()
+    if backend == 'selectolax':
+        if not HAS_SELECTOLAX:
+            raise ValueError("selectolax is not installed")
+        return LexborNode(LexborHTMLParser(decode_html(content)).root)
+    if backend == 'lxml' and not HAS_LXML:
+        raise ValueError("lxml is not installed")
+    if backend not in ('lxml', 'html.parser'):
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    return BeautifulSoup(content, backend)
+
+
+def _css_for(name=None, attrs=None, class_=None, **kwargs):
+    """find/find_all 인자를 CSS 선택자로 변환"""
+    attrs = dict(attrs or {})
+    attrs.update(kwargs)
+    if class_:
+        attrs['class'] = class_
+
+    selector = name or '*'
+    for key, value in attrs.items():
+        if key == 'class':
+            selector += ''.join(f'.{cls}' for cls in str(value).split())
+        elif key == 'id':
+            selector += f'#{value}'
+        elif value is True:
+            selector += f'[{key}]'
+        else:
+            selector += f'[{key}="{value}"]'
+    return selector
+
+
+class LexborNode:
+    """selectolax 노드를 BeautifulSoup 요소처럼 감싸는 어댑터"""
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self):
+        return self.node.tag
+
+    @property
+    def attrs(self):
+        return self.node.attributes
+
+    @property
+    def parent(self):
+        node = self.node.parent
+        return LexborNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [LexborNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector):
+        node = self.node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def find_all(self, name=None, attrs=None, class_=None, **kwargs):
+        return self.select(_css_for(name, attrs, class_, **kwargs))
+
+    def find(self, name=None, attrs=None, class_=None, **kwargs):
+        return self.select_one(_css_for(name, attrs, class_, **kwargs))
+
+    def get(self, key, default=None):
+        value = self.node.attributes.get(key)
+        return default if value is None else value
+
+    def get_text(self, separator='', strip=False):
+        return self.node.text(separator=separator, strip=strip)
+
+    def __getitem__(self, key):
+        return self.node.attributes[key]
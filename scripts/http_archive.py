@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+HTTP 녹화/재생 아카이브
+record 모드에서는 크롤러가 받은 모든 응답을 WARC 형식 파일에 저장하고,
+replay 모드에서는 네트워크 대신 아카이브에서 응답을 돌려주어(선택적으로 지연 시간을 흉내 내어)
+실제 사이트 없이도 같은 입력으로 크롤링 시간과 파싱 처리량을 반복 측정할 수 있게 합니다.
+"""
+
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from email.parser import BytesHeaderParser
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+ARCHIVE_MODES = ('record', 'replay')
+
+# 본문은 압축을 푼 상태로 저장하므로 전송 관련 헤더는 제외
+SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class ArchiveMissError(requests.ConnectionError):
+    """아카이브에 없는 URL 요청 (크롤러에서는 네트워크 오류처럼 처리)"""
+
+
+def _http_block(response):
+    """응답을 HTTP/1.1 메시지 바이트로 직렬화"""
+    body = response.content or b''
+    lines = [f"HTTP/1.1 {response.status_code} {response.reason or ''}".rstrip()]
+    for name, value in response.headers.items():
+        if name.lower() not in SKIPPED_HEADERS:
+            lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {len(body)}")
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8') + body
+
+
+def read_records(path):
+    """WARC 파일의 (WARC 헤더, HTTP 메시지 바이트) 레코드를 차례로 생성"""
+    with open(path, 'rb') as f:
+        while True:
+            line = f.readline()
+            if not line:
+                return
+            if not line.strip():
+                continue
+            header_lines = []
+            while True:
+                line = f.readline()
+                if not line or not line.strip():
+                    break
+                header_lines.append(line)
+            headers = BytesHeaderParser().parsebytes(b''.join(header_lines))
+            block = f.read(int(headers.get('Content-Length', 0)))
+            yield headers, block
+
+
+def parse_http_block(block):
+    """HTTP 메시지 바이트를 (상태 코드, 사유, 헤더, 본문)으로 분리"""
+    head, _, body = block.partition(b'\r\n\r\n')
+    status_line, _, header_bytes = head.partition(b'\r\n')
+    parts = status_line.decode('latin-1').split(' ', 2)
+    status = int(parts[1])
+    reason = parts[2] if len(parts) > 2 else ''
+    headers = CaseInsensitiveDict(BytesHeaderParser().parsebytes(header_bytes).items())
+    return status, reason, headers, body
+
+
+class HTTPArchive:
+    def __init__(self, path, mode='replay', latency=0.0, jitter=0.0):
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        # replay 모드에서 응답마다 기다릴 시간(초): latency ± jitter
+        self.latency = latency
+        self.jitter = jitter
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+        self._lock = threading.Lock()
+        self._index = {}
+
+        if mode == 'replay':
+            for headers, block in read_records(path):
+                if headers.get('WARC-Type') == 'response':
+                    # 같은 URL이 여러 번 녹화되었으면 마지막 응답 사용
+                    self._index[headers['WARC-Target-URI']] = (headers.get('WARC-Final-URI'), block)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def __len__(self):
+        return len(self._index)
+
+    def urls(self):
+        """아카이브에 있는 요청 URL 목록"""
+        return list(self._index)
+
+    def record(self, url, response):
+        """응답 하나를 WARC response 레코드로 추가"""
+        block = _http_block(response)
+        warc_headers = [
+            'WARC/1.0',
+            'WARC-Type: response',
+            f'WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>',
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f'WARC-Target-URI: {url}',
+        ]
+        if response.url and response.url != url:
+            warc_headers.append(f'WARC-Final-URI: {response.url}')
+        warc_headers += [
+            'Content-Type: application/http; msgtype=response',
+            f'Content-Length: {len(block)}',
+        ]
+        record = ('\r\n'.join(warc_headers) + '\r\n\r\n').encode('utf-8') + block + b'\r\n\r\n'
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                f.write(record)
+            self.recorded += 1
+
+    def replay(self, url, request=None):
+        """녹화된 응답 반환 (없으면 ArchiveMissError)"""
+        entry = self._index.get(url)
+        if entry is None:
+            with self._lock:
+                self.missed += 1
+            raise ArchiveMissError(f"{url} is not in archive {self.path}")
+
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        final_url, block = entry
+        status, reason, headers, body = parse_http_block(block)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = headers
+        response.url = final_url or url
+        response.encoding = requests.utils.get_encoding_from_headers(headers)
+        response.request = request
+        response._content = body
+        response._content_consumed = True
+        response.from_archive = True
+        with self._lock:
+            self.replayed += 1
+        return response
+
+    def stats(self):
+        return {
+            'mode': self.mode,
+            'recorded': self.recorded,
+            'replayed': self.replayed,
+            'missed': self.missed,
+            'urls': len(self._index)
+        }
+
+
+def archive_from_env(base_dir):
+    """환경변수로 아카이브 설정 (CRAWL_ARCHIVE=record|replay, 없으면 None)
+
+    CRAWL_ARCHIVE_PATH: 아카이브 파일 (기본값 .cache/archive/crawl.warc)
+    CRAWL_REPLAY_LATENCY: 재생 시 응답마다 흉내 낼 지연 시간(초)
+    """
+    mode = os.getenv('CRAWL_ARCHIVE')
+    if not mode:
+        return None
+    path = os.getenv('CRAWL_ARCHIVE_PATH') or os.path.join(base_dir, '.cache', 'archive', 'crawl.warc')
+    return HTTPArchive(path, mode, latency=float(os.getenv('CRAWL_REPLAY_LATENCY') or 0))
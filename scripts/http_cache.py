@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+디스크 HTTP 캐시
+ETag / Last-Modified 와 함께 응답을 저장하고, 재요청 시 조건부 GET으로
+변경 여부만 확인하여 304 응답이면 디스크의 본문을 그대로 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 저장하지 않음
+SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class HTTPCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화 (304로 재사용한 응답 수, 새로 받은 응답 수)"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _paths(self, url):
+        """URL에 해당하는 메타데이터/본문 파일 경로"""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def get(self, url):
+        """캐시된 메타데이터 반환 (없으면 None)"""
+        meta_path, body_path = self._paths(url)
+        if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, entry):
+        """캐시 항목으로 조건부 요청 헤더 생성"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """검증자(ETag/Last-Modified)가 있는 200 응답을 저장"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified):
+            return False
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding,
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            'stored_at': time.time()
+        }
+
+        self._write(body_path, response.content)
+        self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        return True
+
+    def _write(self, path, data):
+        """동시 요청에서도 깨진 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체"""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def build_response(self, entry, not_modified):
+        """304 응답과 캐시된 본문으로 200 응답 복원"""
+        _, body_path = self._paths(entry['url'])
+        with open(body_path, 'rb') as f:
+            body = f.read()
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response.encoding = entry.get('encoding')
+        response._content = body
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+크롤러 공용 HTTP 클라이언트 팩토리
+호스트별 커넥션 풀 크기, keep-alive, 연결/읽기 타임아웃을 맞춘 CrawlSession을 만듭니다.
+httpx와 h2가 설치되어 있고 http2=True이면 HTTPS 요청을 HTTP/2로 보내
+같은 사이트의 여러 기사 요청을 연결 하나에서 동시에 주고받습니다.
+"""
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from crawl_session import CrawlSession
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = HAS_HTTPX
+except ImportError:
+    HAS_HTTP2 = False
+
+
+def _httpx_timeout(timeout):
+    """requests 형식 타임아웃(초 또는 (연결, 읽기))을 httpx.Timeout으로 변환"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class _StreamReader:
+    """httpx 응답 본문을 requests의 response.raw처럼 read(n)으로 읽게 하는 래퍼"""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None):
+        while amt is None or len(self._buffer) < amt:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                self.close()
+                break
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.ReadTimeout(e)
+            except httpx.HTTPError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """httpx(HTTP/2) 클라이언트로 요청을 보내는 requests 전송 어댑터
+
+    세션의 속도 제한, 캐시, 재시도, 리다이렉트 처리는 그대로 사용하고 전송 계층만 바꿉니다.
+    """
+
+    def __init__(self, max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0):
+        super().__init__()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        # 인증서 검증 여부별 클라이언트 (세션마다 verify 설정이 다를 수 있음)
+        self._clients = {}
+
+    def _client(self, verify):
+        verify = bool(verify)
+        if verify not in self._clients:
+            self._clients[verify] = httpx.Client(
+                http2=True, verify=verify, limits=self.limits, follow_redirects=False
+            )
+        return self._clients[verify]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        client = self._client(verify)
+        outgoing = client.build_request(
+            request.method, request.url,
+            headers=dict(request.headers), content=request.body,
+            timeout=_httpx_timeout(timeout) if timeout is not None else None
+        )
+        try:
+            upstream = client.send(outgoing, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except httpx.ConnectError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.RequestException(e, request=request)
+
+        response = requests.Response()
+        response.status_code = upstream.status_code
+        response.reason = upstream.reason_phrase
+        # 본문은 httpx가 이미 압축을 풀어서 전달
+        headers = CaseInsensitiveDict(upstream.headers)
+        headers.pop('Content-Encoding', None)
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _StreamReader(upstream)
+        response.http_version = upstream.http_version
+        return response
+
+    def close(self):
+        for client in self._clients.values():
+            client.close()
+        self._clients = {}
+
+
+def create_session(pool_connections=16, pool_maxsize=16, connect_timeout=5.0, read_timeout=15.0,
+                   http2=False, **session_kwargs):
+    """풀·타임아웃을 설정한 CrawlSession 생성
+
+    pool_connections: 커넥션 풀을 유지할 호스트 수
+    pool_maxsize: 호스트별로 유지할 keep-alive 연결 수 (동시 요청 수 이상으로 설정)
+    http2: HTTPS 요청을 HTTP/2로 전송 (httpx와 h2가 없으면 HTTP/1.1 사용)
+    session_kwargs: CrawlSession 인자 (rate_limiter, cache, retry, breaker, archive, metrics)
+    """
+    session = CrawlSession(**session_kwargs)
+    session.timeout = (connect_timeout, read_timeout)
+
+    # 재시도는 CrawlSession의 재시도 정책이 담당하므로 urllib3 재시도는 끔
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    if http2:
+        if HAS_HTTP2:
+            session.mount('https://', HTTP2Adapter(
+                max_connections=pool_connections * pool_maxsize,
+                max_keepalive_connections=pool_connections * pool_maxsize
+            ))
+        else:
+            print("HTTP/2 requested but httpx[http2] is not installed; using HTTP/1.1")
+
+    return session
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+다중 키워드 매처 (Aho-Corasick)
+모든 키워드를 하나의 오토마톤으로 컴파일하여 텍스트를 한 번만 훑으면서
+일치한 키워드, 분류(카테고리), 위치를 찾습니다.
+pyahocorasick이 설치되어 있으면 C 구현을, 없으면 순수 파이썬 구현을 사용합니다.
+"""
+
+from collections import deque, namedtuple
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# start/end는 원문 기준 위치 (text[start:end] == 일치한 부분)
+KeywordHit = namedtuple('KeywordHit', ['keyword', 'category', 'start', 'end'])
+
+
+def _is_ascii_word_char(text, index):
+    """index 위치가 ASCII 영문자·숫자인지 (텍스트 범위 밖이면 False)"""
+    return 0 <= index < len(text) and text[index].isascii() and text[index].isalnum()
+
+
+class KeywordMatcher:
+    def __init__(self, keywords, use_native=None):
+        """keywords: 키워드 목록, 또는 {카테고리: [키워드, ...]} 사전
+
+        대소문자를 구분하지 않습니다. 같은 키워드가 여러 카테고리에 있으면 모두 보고합니다.
+        영문 키워드(SK, LG 등)는 영단어 안의 일치('Ask', 'desk')를 피하도록 앞뒤가 영문자·숫자가 아닐 때만 일치합니다.
+        """
+        if isinstance(keywords, dict):
+            entries = [(keyword, category) for category, words in keywords.items() for keyword in words]
+        else:
+            entries = [(keyword, None) for keyword in keywords]
+
+        self.keywords = {}
+        for keyword, category in entries:
+            if keyword:
+                self.keywords.setdefault(keyword.lower(), []).append((keyword, category))
+        # 단어 경계를 확인할 영문 키워드
+        self._bounded = {key for key in self.keywords if key.isascii()}
+
+        self.native = HAS_AHOCORASICK if use_native is None else use_native and HAS_AHOCORASICK
+        if self.native:
+            self._automaton = ahocorasick.Automaton()
+            for key, values in self.keywords.items():
+                self._automaton.add_word(key, (len(key), values))
+            if self.keywords:
+                self._automaton.make_automaton()
+        else:
+            self._build()
+
+    def _build(self):
+        """순수 파이썬 오토마톤 구성 (트라이 + 실패 링크)"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for key, values in self.keywords.items():
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append((len(key), values))
+
+        # 너비 우선으로 실패 링크 계산 (실패 노드의 출력도 이어받음)
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self._goto[node].items():
+                pending.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _scan(self, text):
+        """(끝 위치, 키워드 길이, [(키워드, 카테고리)]) 를 텍스트 순서대로 생성"""
+        text = text.lower()
+        for end, length, values in self._scan_automaton(text):
+            start = end - length
+            if text[start:end] in self._bounded and (
+                _is_ascii_word_char(text, start - 1) or _is_ascii_word_char(text, end)
+            ):
+                continue
+            yield end, length, values
+
+    def _scan_automaton(self, text):
+        """오토마톤의 모든 일치 (단어 경계 확인 전)"""
+        if self.native:
+            if self.keywords:
+                for end, (length, values) in self._automaton.iter(text):
+                    yield end + 1, length, values
+            return
+
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, values in output[node]:
+                yield index + 1, length, values
+
+    def find_all(self, text):
+        """일치한 모든 키워드의 KeywordHit 목록 (위치 순, 겹치는 일치 포함)"""
+        hits = []
+        for end, length, values in self._scan(text or ''):
+            for keyword, category in values:
+                hits.append(KeywordHit(keyword, category, end - length, end))
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return hits
+
+    def search(self, text):
+        """키워드가 하나라도 있는지 여부 (첫 일치에서 중단)"""
+        for _ in self._scan(text or ''):
+            return True
+        return False
+
+    def categories(self, text):
+        """일치한 카테고리 목록 (처음 등장한 순서, 중복 없음)"""
+        found = []
+        for hit in self.find_all(text):
+            if hit.category is not None and hit.category not in found:
+                found.append(hit.category)
+        return found
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(keywords):
+    """키워드 튜플로 만든 매처 (같은 키워드 목록은 한 번만 컴파일)"""
+    return KeywordMatcher(keywords)
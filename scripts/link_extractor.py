@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+목록 페이지 링크 추출기
+섹션/아카이브 페이지에서 기사 링크만 필요할 때 전체 DOM을 만들지 않고
+<a> 요소만 파싱(strainer)하거나 정규식으로 훑어(regex) (URL, 제목) 목록을 반환합니다.
+"""
+
+import html
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from html_parser import HAS_LXML, decode_html, parse_html
+
+LINK_MODES = ('full', 'strainer', 'regex')
+
+ANCHOR_RE = re.compile(
+    r'<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\')[^>]*>(.*?)</a\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _anchor_text(inner_html):
+    """앵커 내부 HTML에서 텍스트 추출 (get_text(strip=True)와 같은 결과)"""
+    pieces = (html.unescape(piece).strip() for piece in TAG_RE.split(inner_html))
+    return ''.join(piece for piece in pieces if piece)
+
+
+def extract_links(content, href_contains, mode='regex', backend=None, max_links=None):
+    """href에 href_contains(문자열 또는 문자열 튜플)가 포함된 링크의 (href, 제목) 목록을 문서 순서대로 반환"""
+    patterns = (href_contains,) if isinstance(href_contains, str) else tuple(href_contains)
+
+    def wanted(href):
+        return bool(href) and any(pattern in href for pattern in patterns)
+
+    links = []
+
+    if mode == 'regex':
+        for match in ANCHOR_RE.finditer(decode_html(content)):
+            href = html.unescape(match.group(1) or match.group(2) or '')
+            if wanted(href):
+                links.append((href, _anchor_text(match.group(3))))
+                if max_links and len(links) >= max_links:
+                    break
+        return links
+
+    if mode == 'strainer':
+        # SoupStrainer는 BeautifulSoup 백엔드에서만 동작
+        features = 'lxml' if HAS_LXML else 'html.parser'
+        only_links = SoupStrainer('a', href=wanted)
+        anchors = BeautifulSoup(content, features, parse_only=only_links).find_all('a')
+    elif mode == 'full':
+        selector = ', '.join(f'a[href*="{pattern}"]' for pattern in patterns)
+        anchors = parse_html(content, backend).select(selector)
+    else:
+        raise ValueError(f"Unknown link extraction mode: {mode}")
+
+    for anchor in anchors:
+        links.append((anchor.get('href'), anchor.get_text(strip=True)))
+        if max_links and len(links) >= max_links:
+            break
+    return links
@@ -10,6 +10,20 @@ import re
 from datetime import datetime
 from typing import List, Dict
 
+from keyword_matcher import KeywordMatcher
+
+# 분류별 경제 키워드
+TOPIC_KEYWORDS = {
+    '주식시장': ['주가', '코스피', '코스닥', '증시', '주식', '투자', '증권', 'ETF', '펀드'],
+    '부동산': ['부동산', '아파트', '주택', '매매', '임대', '전세', '월세', '재개발', '재건축'],
+    '금리정책': ['금리', '중앙은행', '한국은행', '기준금리', '인플레이션', '물가'],
+    '경기동향': ['경기', '성장', 'GDP', '경제', '회복', '부진', '호황', '침체'],
+    '국제정치': ['APEC', '정상회의', '미국', '중국', '일본', '외교', '무역'],
+    '기업': ['삼성', 'LG', 'SK', '현대', '기업', '매출', '수익', '실적'],
+    '고용': ['고용', '취업', '실업', '구직', '채용', '노동']
+}
+TOPIC_MATCHER = KeywordMatcher(TOPIC_KEYWORDS)
+
 class LocalSummarizer:
     def __init__(self):
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,26 +40,7 @@ class LocalSummarizer:
     
     def extract_keywords(self, text):
         """텍스트에서 키워드 추출"""
-        economy_keywords = {
-            '주식시장': ['주가', '코스피', '코스닥', '증시', '주식', '투자', '증권', 'ETF', '펀드'],
-            '부동산': ['부동산', '아파트', '주택', '매매', '임대', '전세', '월세', '재개발', '재건축'],
-            '금리정책': ['금리', '중앙은행', '한국은행', '기준금리', '인플레이션', '물가'],
-            '경기동향': ['경기', '성장', 'GDP', '경제', '회복', '부진', '호황', '침체'],
-            '국제정치': ['APEC', '정상회의', '미국', '중국', '일본', '외교', '무역'],
-            '기업': ['삼성', 'LG', 'SK', '현대', '기업', '매출', '수익', '실적'],
-            '고용': ['고용', '취업', '실업', '구직', '채용', '노동']
-        }
-        
-        found_keywords = []
-        text_lower = text.lower()
-        
-        for category, keywords in economy_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    found_keywords.append(category)
-                    break
-        
-        return list(set(found_keywords))
+        return TOPIC_MATCHER.categories(text)
     
     def generate_news_summary(self, news_item):
         """개별 뉴스 요약 생성"""
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+유사 중복 기사 탐지기
+같은 통신 기사를 여러 매체가 제목만 조금 바꿔 싣는 경우([종목+], (종합) 같은 꼬리표 포함)를 찾기 위해
+정규화한 제목+본문의 문자 shingle로 MinHash 서명을 만들고 LSH 밴드 버킷으로 후보 쌍만 비교합니다.
+배치 크기에 선형인 시간으로 동작합니다.
+"""
+
+import hashlib
+import random
+import re
+
+# 제목 앞뒤의 [단독], (종합), <속보> 같은 꼬리표
+TAG_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>|【[^】]*】')
+NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_text(text):
+    """꼬리표, 문장부호, 공백을 제거하고 소문자로 변환"""
+    text = TAG_RE.sub(' ', text or '')
+    return NON_WORD_RE.sub('', text).lower()
+
+
+def shingles(text, size=3):
+    """문자 n-gram 집합 (한국어는 띄어쓰기가 매체마다 달라 단어 대신 문자 단위 사용)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class NearDuplicateDetector:
+    def __init__(self, threshold=0.5, num_perm=64, bands=16, shingle_size=3, body_chars=300, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # 본문은 앞부분만 사용 (매체별 기자명·저작권 문구가 붙는 뒷부분 제외)
+        self.body_chars = body_chars
+
+        # 순열 대신 shingle 해시에 XOR할 64비트 마스크 (seed로 고정하여 실행마다 같은 서명)
+        rng = random.Random(seed)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+
+    def article_text(self, news):
+        """서명에 사용할 기사 텍스트 (정규화한 제목 + 본문 앞부분)"""
+        content = news.get('content') or ''
+        return normalize_text(news.get('title', '') + ' ' + content[:self.body_chars])
+
+    def signature(self, text):
+        """텍스트의 MinHash 서명"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            for shingle in shingles(text, self.shingle_size)
+        ]
+        if not hashes:
+            return (0,) * self.num_perm
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self._masks)
+
+    def similarity(self, sig_a, sig_b):
+        """두 서명으로 추정한 Jaccard 유사도"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / self.num_perm
+
+    def find_duplicates(self, signatures):
+        """각 항목이 중복으로 판정된 앞선 항목의 인덱스 (중복이 아니면 None)"""
+        parent = list(range(len(signatures)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # LSH: 밴드 하나라도 완전히 같은 항목끼리만 후보로 비교
+        buckets = {}
+        for index, sig in enumerate(signatures):
+            for band in range(self.bands):
+                key = (band, sig[band * self.rows:(band + 1) * self.rows])
+                for other in buckets.setdefault(key, []):
+                    if find(other) != find(index) and self.similarity(signatures[other], sig) >= self.threshold:
+                        # 앞선(순위가 높은) 항목을 대표로 유지
+                        low, high = sorted((find(other), find(index)))
+                        parent[high] = low
+                buckets[key].append(index)
+
+        return [None if find(i) == i else find(i) for i in range(len(signatures))]
+
+    def filter(self, news_list):
+        """유사 중복 기사를 제거하고 각 묶음에서 가장 앞선 기사만 남김"""
+        signatures = [self.signature(self.article_text(news)) for news in news_list]
+        duplicates = self.find_duplicates(signatures)
+        return [news for news, duplicate_of in zip(news_list, duplicates) if duplicate_of is None]
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+호스트별 요청 속도 제한기
+사이트(도메인)마다 독립적인 토큰 버킷을 두어 요청 간격을 조절합니다.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+# 2단계 국가 도메인 (예: hankyung.com 은 2단계, mk.co.kr 은 3단계까지 사이트로 본다)
+SECOND_LEVEL_LABELS = {'co', 'or', 'go', 'ne', 'ac', 're', 'pe'}
+
+
+def domain_key(url):
+    """URL에서 속도 제한 단위가 되는 사이트 도메인 추출"""
+    host = (urlparse(url).hostname or '').lower()
+    labels = host.split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = float(max(burst, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기하고 실제 대기 시간 반환"""
+        if self.rate <= 0:
+            return 0.0
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    def __init__(self, requests_per_second=1.0, burst=1, host_rates=None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        # 도메인별 개별 설정: {'hankyung.com': 2.0} 또는 {'hankyung.com': (2.0, 4)}
+        self.host_rates = host_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key):
+        """도메인별 토큰 버킷 반환 (없으면 생성)"""
+        with self._lock:
+            if key not in self._buckets:
+                rate = self.host_rates.get(key, self.requests_per_second)
+                burst = self.burst
+                if isinstance(rate, (tuple, list)):
+                    rate, burst = rate
+                self._buckets[key] = TokenBucket(rate, burst)
+            return self._buckets[key]
+
+    def acquire(self, url):
+        """URL이 속한 도메인의 요청 허가를 받을 때까지 대기"""
+        return self._bucket(domain_key(url)).acquire()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+수집 기사 저장소
+이미 크롤링한 기사 URL, 본문 해시, 발행시간을 SQLite에 기록하여
+다음 실행에서는 새 기사만 상세 페이지를 요청하도록 합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+def content_hash(text):
+    """본문 해시 (변경 감지용)"""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+class SeenArticleStore:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                content_hash TEXT,
+                published_at TEXT,
+                first_seen TEXT,
+                last_seen TEXT,
+                data TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at)")
+        # 과거 기사 수집(backfill) 작업 단위(소스·날짜)별 완료 기록
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                job TEXT PRIMARY KEY,
+                articles INTEGER,
+                completed_at TEXT
+            )
+        """)
+        # 페이지 수 제한에 걸린 아카이브 목록의 다음 실행 시작 페이지
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_pages (
+                job TEXT,
+                listing TEXT,
+                next_page INTEGER,
+                PRIMARY KEY (job, listing)
+            )
+        """)
+        # 상세 수집에 실패한 기사 URL별 시도 횟수 (계속 실패하는 기사가 작업 완료를 막지 않도록)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_failures (
+                job TEXT,
+                url TEXT,
+                attempts INTEGER,
+                last_failed TEXT,
+                PRIMARY KEY (job, url)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, url):
+        """저장된 기사 데이터 반환 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM articles WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add(self, article):
+        """기사 저장 (이미 있으면 내용과 마지막 확인 시각 갱신)"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO articles (url, title, content_hash, published_at, first_seen, last_seen, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    content_hash = excluded.content_hash,
+                    published_at = excluded.published_at,
+                    last_seen = excluded.last_seen,
+                    data = excluded.data
+            """, (
+                article['url'],
+                article.get('title'),
+                content_hash(article.get('content')),
+                article.get('publishedAt'),
+                now,
+                now,
+                json.dumps(article, ensure_ascii=False)
+            ))
+            self._conn.commit()
+
+    def mark_done(self, job, articles=0):
+        """작업 완료 기록 (중단 후 다시 실행하면 건너뜀, 이어받기 페이지 기록은 삭제)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (job, articles, completed_at) VALUES (?, ?, ?)",
+                (job, articles, datetime.now().isoformat())
+            )
+            self._conn.execute("DELETE FROM checkpoint_pages WHERE job = ?", (job,))
+            self._conn.commit()
+
+    def next_page(self, job, listing):
+        """목록을 이어서 읽을 페이지 번호 (기록이 없으면 1)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_page FROM checkpoint_pages WHERE job = ? AND listing = ?", (job, listing)
+            ).fetchone()
+        return row[0] if row else 1
+
+    def save_next_page(self, job, listing, page):
+        """다음 실행에서 목록을 이어서 읽을 페이지 번호 기록"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoint_pages (job, listing, next_page) VALUES (?, ?, ?)",
+                (job, listing, page)
+            )
+            self._conn.commit()
+
+    def record_failure(self, job, url):
+        """기사 상세 수집 실패 기록 후 누적 시도 횟수 반환"""
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO checkpoint_failures (job, url, attempts, last_failed) VALUES (?, ?, 1, ?)
+                ON CONFLICT(job, url) DO UPDATE SET
+                    attempts = attempts + 1,
+                    last_failed = excluded.last_failed
+            """, (job, url, datetime.now().isoformat()))
+            self._conn.commit()
+            return self._conn.execute(
+                "SELECT attempts FROM checkpoint_failures WHERE job = ? AND url = ?", (job, url)
+            ).fetchone()[0]
+
+    def given_up(self, job, max_attempts):
+        """max_attempts번 이상 실패하여 더 요청하지 않을 기사 URL 집합"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM checkpoint_failures WHERE job = ? AND attempts >= ?", (job, max_attempts)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def done_jobs(self, prefix=''):
+        """완료된 작업 이름 집합"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job FROM checkpoints WHERE job LIKE ?", (prefix + '%',)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def clear_checkpoints(self, prefix=''):
+        """완료·이어받기 페이지·실패 기록 삭제 (처음부터 다시 수집)"""
+        with self._lock:
+            for table in ('checkpoints', 'checkpoint_pages', 'checkpoint_failures'):
+                self._conn.execute(f"DELETE FROM {table} WHERE job LIKE ?", (prefix + '%',))
+            self._conn.commit()
+
+    def count(self):
+        """저장된 기사 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
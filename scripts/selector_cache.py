@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+본문/발행시간 선택자 학습 캐시
+같은 도메인의 같은 형식 페이지(예: www.hankyung.com/article/#i)는 항상 같은 선택자로 본문이 잡히므로,
+성공한 선택자를 도메인·페이지 형식별로 기억해 두었다가 다음 기사에서 가장 먼저 시도합니다.
+학습 결과는 JSON 파일로 저장하여 다음 실행에서도 사용합니다.
+"""
+
+import json
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+DIGITS_RE = re.compile(r'\d+')
+
+
+def page_template(url):
+    """URL을 (도메인, 페이지 형식)으로 변환 (경로의 숫자는 '#'로 치환)"""
+    parts = urlsplit(url)
+    return (parts.hostname or '').lower(), DIGITS_RE.sub('#', parts.path or '/')
+
+
+class SelectorCache:
+    def __init__(self, path=None):
+        # path가 없으면 메모리에서만 학습
+        self.path = path
+        self._lock = threading.Lock()
+        # {도메인: {페이지 형식: {'content': 선택자, 'time': 선택자}}}
+        self._learned = {}
+        self._dirty = False
+        self.hits = 0
+        self.learned = 0
+        self.density_fallbacks = 0
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._learned = json.load(f)
+            except (OSError, ValueError):
+                self._learned = {}
+
+    def __getstate__(self):
+        # 파이프라인 파싱 프로세스에는 학습 결과만 복사 (저장은 메인 프로세스만)
+        return {'learned': self._learned}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self._learned = state['learned']
+
+    def lookup(self, url, kind):
+        """학습된 선택자 (없으면 None)"""
+        domain, template = page_template(url)
+        return self._learned.get(domain, {}).get(template, {}).get(kind)
+
+    def ordered(self, url, kind, selectors):
+        """학습된 선택자를 맨 앞으로 옮긴 선택자 목록"""
+        learned = self.lookup(url, kind)
+        if learned not in selectors:
+            return selectors
+        return [learned] + [selector for selector in selectors if selector != learned]
+
+    def learn(self, url, kind, selector):
+        """성공한 선택자 기록"""
+        domain, template = page_template(url)
+        with self._lock:
+            entry = self._learned.setdefault(domain, {}).setdefault(template, {})
+            if entry.get(kind) == selector:
+                self.hits += 1
+                return
+            entry[kind] = selector
+            self.learned += 1
+            self._dirty = True
+
+    def record_fallback(self):
+        """어떤 본문 선택자도 맞지 않아 텍스트 밀도 추출을 사용한 횟수"""
+        with self._lock:
+            self.density_fallbacks += 1
+
+    def save(self):
+        """바뀐 학습 결과를 파일에 저장"""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps(self._learned, ensure_ascii=False, indent=2, sort_keys=True)
+            self._dirty = False
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def stats(self):
+        return {'hits': self.hits, 'learned': self.learned, 'density_fallbacks': self.density_fallbacks}
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+사이트맵 기반 기사 탐색
+robots.txt에 선언된 (뉴스) 사이트맵을 스트리밍 XML 파서로 읽어
+기사 URL, 제목, 발행시간을 사이트당 몇 번의 가벼운 요청으로 얻습니다.
+목록 페이지를 여러 장 받아 선택자로 링크를 찾는 대신 사용하고, 사이트맵이 없으면 목록 페이지로 돌아갑니다.
+"""
+
+import threading
+import zlib
+from collections import namedtuple
+from urllib.parse import urljoin
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from time_parser import parse_time
+
+# kind: 'url'(기사) 또는 'sitemap'(사이트맵 인덱스의 하위 사이트맵)
+SitemapEntry = namedtuple('SitemapEntry', ['url', 'title', 'published_at', 'kind'])
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _local_name(tag):
+    """'{네임스페이스}이름' 태그에서 이름만 반환"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _child_text(elem, name):
+    """자손 요소 중 이름이 일치하는 첫 요소의 텍스트 (네임스페이스 무시)"""
+    for child in elem.iter():
+        if _local_name(child.tag) == name and child.text:
+            return child.text.strip()
+    return None
+
+
+def parse_robots_sitemaps(text, base_url):
+    """robots.txt 본문에서 Sitemap: 선언 URL 목록 추출"""
+    sitemaps = []
+    for line in text.splitlines():
+        name, _, value = line.partition(':')
+        if name.strip().lower() == 'sitemap' and value.strip():
+            sitemaps.append(urljoin(base_url, value.strip()))
+    return sitemaps
+
+
+def iter_sitemap(chunks):
+    """XML 바이트 조각을 받으면서 SitemapEntry를 차례로 생성 (gzip 압축 사이트맵 지원)
+
+    <url>/<sitemap> 요소가 끝날 때마다 항목을 내보내고 요소를 비워
+    사이트맵 전체를 메모리에 올리지 않습니다.
+    """
+    parser = XMLPullParser(events=('end',))
+    decompressor = None
+    first = True
+
+    for chunk in chunks:
+        if first:
+            first = False
+            # Content-Encoding 없이 전송된 .xml.gz 파일
+            if chunk.startswith(GZIP_MAGIC):
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        if decompressor:
+            chunk = decompressor.decompress(chunk)
+        parser.feed(chunk)
+        yield from _read_entries(parser)
+
+    parser.close()
+    yield from _read_entries(parser)
+
+
+def _read_entries(parser):
+    for _, elem in parser.read_events():
+        name = _local_name(elem.tag)
+        if name not in ('url', 'sitemap'):
+            continue
+        loc = _child_text(elem, 'loc')
+        if loc:
+            if name == 'sitemap':
+                yield SitemapEntry(loc, None, None, 'sitemap')
+            else:
+                # 뉴스 사이트맵의 발행시간, 없으면 마지막 수정 시각
+                published = _child_text(elem, 'publication_date') or _child_text(elem, 'lastmod')
+                yield SitemapEntry(loc, _child_text(elem, 'title'), parse_time(published), 'url')
+        elem.clear()
+
+
+class SitemapDiscovery:
+    def __init__(self, session, max_sitemaps=4, max_entries=5000, chunk_size=16 * 1024):
+        self.session = session
+        # 사이트당 읽을 사이트맵 파일 수 (인덱스 포함)
+        self.max_sitemaps = max_sitemaps
+        # 사이트맵 하나에서 읽을 최대 항목 수
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._robots = {}
+        self.requests = 0
+        self.entries = 0
+        self.errors = 0
+
+    def _count(self, requests=0, entries=0, errors=0):
+        with self._lock:
+            self.requests += requests
+            self.entries += entries
+            self.errors += errors
+
+    def robots_sitemaps(self, site_url):
+        """robots.txt에 선언된 사이트맵 URL (사이트별로 한 번만 요청)"""
+        if site_url in self._robots:
+            return self._robots[site_url]
+
+        sitemaps = []
+        try:
+            self._count(requests=1)
+            response = self.session.get(urljoin(site_url, '/robots.txt'))
+            if response.status_code == 200:
+                sitemaps = parse_robots_sitemaps(response.text, site_url)
+        except Exception as e:
+            self._count(errors=1)
+            print(f"Error reading robots.txt for {site_url}: {e}")
+
+        self._robots[site_url] = sitemaps
+        return sitemaps
+
+    def read_sitemap(self, url):
+        """사이트맵 하나를 스트리밍으로 읽어 항목 목록 반환 (오류 시 빈 목록)"""
+        entries = []
+        self._count(requests=1)
+        try:
+            response = self.session.get(url, timeout=self.session.timeout, stream=True)
+            try:
+                response.raise_for_status()
+                for entry in iter_sitemap(response.iter_content(chunk_size=self.chunk_size)):
+                    entries.append(entry)
+                    if len(entries) >= self.max_entries:
+                        break
+            finally:
+                response.close()
+        except (ParseError, zlib.error) as e:
+            self._count(errors=1)
+            print(f"Invalid sitemap {url}: {e}")
+        except Exception as e:
+            self._count(errors=1)
+            print(f"Error reading sitemap {url}: {e}")
+
+        self._count(entries=len(entries))
+        return entries
+
+    def discover(self, site_url, fallback_sitemaps=()):
+        """사이트의 기사 항목 목록 (뉴스 사이트맵 우선, 인덱스는 하위 사이트맵을 따라감)"""
+        pending = self.robots_sitemaps(site_url) or list(fallback_sitemaps)
+        # 이름에 news가 들어간 사이트맵이 있으면 그것만 사용
+        news_sitemaps = [url for url in pending if 'news' in url.lower()]
+        pending = news_sitemaps or pending
+
+        articles = []
+        visited = set()
+        while pending and len(visited) < self.max_sitemaps:
+            url = pending.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+
+            children = []
+            for entry in self.read_sitemap(url):
+                if entry.kind == 'sitemap':
+                    children.append(entry.url)
+                else:
+                    articles.append(entry)
+            # 인덱스에서도 뉴스 사이트맵을 먼저 읽음
+            children.sort(key=lambda child: 'news' not in child.lower())
+            pending = children + pending
+
+        return articles
+
+    def stats(self):
+        return {'requests': self.requests, 'entries': self.entries, 'errors': self.errors}
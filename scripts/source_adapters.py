@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+뉴스 소스 어댑터
+네이버, 한국경제, 매일경제, 연합뉴스의 목록 URL, 링크 규칙, 본문/시간 선택자를 정의합니다.
+크롤러는 생성자 키워드 인자로 기사 수나 본문 길이 같은 값을 덮어써서 사용합니다.
+"""
+
+from crawl_engine import SourceAdapter
+from keyword_matcher import compile_keywords
+
+# 경제 관련 뉴스 판별 키워드
+ECONOMY_KEYWORDS = [
+    '경제', '금리', '주가', '환율', '부동산', '투자', '금융', '은행',
+    '증권', '펀드', '채권', '코스피', '코스닥', '증시', '시장',
+    '기업', '매출', '수익', '성장', '인플레이션', '물가', '고용',
+    '정부', '정책', '세금', '예산', '국채', '통화', '중앙은행',
+    'GDP', '경기', '회복', '부진', '호황', '침체', '실업',
+    '삼성', 'LG', 'SK', '현대', '기아', '포스코', 'KT', 'SKT',
+    'APEC', '정상회의', '미국', '중국', '일본', '외교', '무역',
+    '원달러', '원화', '달러', '엔화', '유로', '위안'
+]
+
+
+class NaverAdapter(SourceAdapter):
+    key = 'naver'
+    name = '네이버뉴스'
+    listing_urls = ["https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1=101"]
+    archive_url_templates = ["https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1=101&date={date}"]
+    archive_page_param = 'page'
+    link_patterns = ('/read.naver', '/article/')
+    link_selectors = [
+        'a[href*="/read.naver?mode=LSD"]',
+        'a[href*="/article/"]',
+        '.cluster_group a',
+        '.list_body a',
+        '.news_area a'
+    ]
+    links_per_selector = 10
+    content_selectors = [
+        '#newsct_article',
+        '.news_end_body',
+        '.article_body',
+        '.news_body',
+        '.article_view'
+    ]
+    time_selectors = [
+        '.t11',
+        '.author em',
+        '.info_group .t11',
+        '.press_logo .t11'
+    ]
+    content_limit = 800
+    max_candidates = 5
+    max_articles = 5
+    keep_failed = True
+    # 제목에 이 단어가 있는 기사만 수집 (None이면 모두 수집)
+    title_keyword = '경제'
+
+    def accept_title(self, title):
+        """경제 섹션 제목만 수집"""
+        return super().accept_title(title) and (not self.title_keyword or self.title_keyword in title)
+
+
+class HankyungAdapter(SourceAdapter):
+    key = 'hankyung'
+    name = '한국경제'
+    listing_urls = ["https://www.hankyung.com/economy"]
+    site_url = "https://www.hankyung.com"
+    feed_urls = ["https://www.hankyung.com/feed/economy"]
+    archive_url_templates = [
+        "https://www.hankyung.com/economy?date={date}",
+        "https://www.hankyung.com/stock?date={date}",
+        "https://www.hankyung.com/finance?date={date}"
+    ]
+    archive_page_param = 'page'
+    link_patterns = ('/article/',)
+    link_selectors = [
+        'a[href*="/article/"]',
+        '.news_list a',
+        '.list_news a',
+        '.article_list a'
+    ]
+    links_per_selector = 10
+    content_selectors = ['.article-body', '.news-body', '.article_view']
+    time_selectors = ['time', '.date', '.publish-time']
+    time_attribute = 'datetime'
+    # 기사 번호: 발행일(yyyymmdd) + 일련번호 (예: /article/2024101812345i)
+    article_id_pattern = r'/article/(\d{8})(\d+)'
+    article_id_has_date = True
+    content_limit = 800
+    max_candidates = 3
+    max_articles = 3
+    keep_failed = True
+
+
+class HankyungEconomyAdapter(HankyungAdapter):
+    """경제 키워드로 걸러낸 한국경제 기사 (섹션·아카이브 페이지 전체 수집)"""
+    link_selectors = [
+        'a[href*="/article/"]',
+        '.news_list a',
+        '.list_news a',
+        '.article_list a',
+        '.news_item a',
+        '.headline a',
+        '.title a',
+        '.news_title a'
+    ]
+    links_per_selector = 15
+    feed_urls = [
+        "https://www.hankyung.com/feed/economy",
+        "https://www.hankyung.com/feed/finance",
+        "https://www.hankyung.com/feed/realestate"
+    ]
+    content_selectors = [
+        '.article-body',
+        '.news-body',
+        '.article_view',
+        '.article-content',
+        '.news-content',
+        '.article_text',
+        '.news_text'
+    ]
+    time_selectors = [
+        'time',
+        '.date',
+        '.publish-time',
+        '.article-date',
+        '.news-date',
+        '.byline'
+    ]
+    time_attribute = None
+    # 제목에 이 중 하나가 있는 기사만 수집 (비어 있으면 모두 수집)
+    economy_keywords = ECONOMY_KEYWORDS
+    content_limit = 1500
+    max_candidates = None
+    max_articles = 8
+    keep_failed = False
+
+    def is_economy_related(self, title):
+        """경제 관련 뉴스인지 확인 (모든 키워드를 한 번에 검사)"""
+        return compile_keywords(tuple(self.economy_keywords)).search(title)
+
+    def accept_title(self, title):
+        return super().accept_title(title) and (not self.economy_keywords or self.is_economy_related(title))
+
+
+class MKAdapter(SourceAdapter):
+    key = 'mk'
+    name = '매일경제'
+    listing_urls = ["https://www.mk.co.kr/news/economy/"]
+    site_url = "https://www.mk.co.kr"
+    feed_urls = ["https://www.mk.co.kr/rss/30100041/"]
+    link_patterns = ('/news/economy/',)
+    link_selectors = [
+        'a[href*="/news/economy/"]',
+        '.news_list a',
+        '.list_news a',
+        '.article_list a'
+    ]
+    links_per_selector = 10
+    content_selectors = ['.news_cnt_detail_wrap', '.article_body', '.news_body']
+    time_selectors = ['.time', '.date', '.publish-time']
+    content_limit = 800
+    max_candidates = 3
+    max_articles = 3
+    keep_failed = True
+
+    def accept_link(self, href):
+        return super().accept_link(href) and 'view' in href
+
+
+class YNAAdapter(SourceAdapter):
+    key = 'yna'
+    name = '연합뉴스'
+    listing_urls = ["https://www.yna.co.kr/economy"]
+    site_url = "https://www.yna.co.kr"
+    feed_urls = ["https://www.yna.co.kr/rss/economy.xml"]
+    link_patterns = ('/economy/',)
+    link_selectors = [
+        'a[href*="/economy/"]',
+        '.news_list a',
+        '.list_news a',
+        '.article_list a'
+    ]
+    links_per_selector = 10
+    content_selectors = ['.story-news', '.article_body', '.news_body']
+    time_selectors = ['.publish-time', '.date', 'time']
+    content_limit = 800
+    max_candidates = 3
+    max_articles = 3
+    keep_failed = True
+
+    def accept_link(self, href):
+        return super().accept_link(href) and 'view' in href
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+스트리밍 기사 본문 추출기
+기사 HTML을 stream=True로 조금씩 내려받아 점진적 파서에 넣고,
+본문 컨테이너에서 필요한 글자 수와 발행시간을 얻었거나 바이트 상한에 도달하면 다운로드를 중단합니다.
+본문 뒤에 있는 발행시간(.date, .byline 등)을 읽기 위해 본문을 다 얻은 뒤에도 발행시간을 찾을 때까지는 계속 파싱합니다.
+"""
+
+import codecs
+import time
+from html.parser import HTMLParser
+
+# 종료 태그가 없는 요소
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr'
+}
+SKIPPED_ELEMENTS = {'script', 'style', 'noscript'}
+
+
+def parse_simple_selector(selector):
+    """'.class', '#id', 'tag' 형태의 선택자를 (종류, 값)으로 변환
+
+    자손 선택자('.info_group .t11')는 마지막 단계만 사용합니다.
+    """
+    selector = selector.split()[-1]
+    if selector.startswith('.'):
+        return ('class', selector[1:])
+    if selector.startswith('#'):
+        return ('id', selector[1:])
+    return ('tag', selector.lower())
+
+
+def _matches(parsed, tag, attrs):
+    """시작 태그가 선택자와 일치하는지 확인"""
+    kind, value = parsed
+    if kind == 'tag':
+        return tag == value
+    if kind == 'id':
+        return attrs.get('id') == value
+    return value in (attrs.get('class') or '').split()
+
+
+class StreamingArticleExtractor(HTMLParser):
+    def __init__(self, content_selectors, time_selectors=(), max_chars=1500):
+        super().__init__(convert_charrefs=True)
+        self.content_selectors = [parse_simple_selector(s) for s in content_selectors]
+        self.time_selectors = [parse_simple_selector(s) for s in time_selectors]
+        self.max_chars = max_chars
+
+        self.content_parts = []
+        self.content_length = 0
+        self.content_depth = 0
+        self.content_done = False
+
+        self.time_texts = {}
+        self.time_index = None
+        self.time_depth = 0
+        self.time_parts = []
+
+        self.skip_depth = 0
+
+    @property
+    def done(self):
+        """본문을 충분히 얻었고 발행시간도 찾았는지 (시간 선택자가 없으면 본문만) 여부"""
+        return self.content_done and (not self.time_selectors or self.time_text() is not None)
+
+    @property
+    def content(self):
+        return ''.join(self.content_parts)
+
+    def time_text(self):
+        """선택자 우선순위가 가장 높은 발행시간 텍스트"""
+        for index in sorted(self.time_texts):
+            if self.time_texts[index]:
+                return self.time_texts[index]
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        void = tag in VOID_ELEMENTS
+
+        if tag in SKIPPED_ELEMENTS:
+            self.skip_depth += 1
+
+        # 본문을 다 얻은 뒤에는 발행시간 요소만 찾음
+        if not self.content_done and not void:
+            if self.content_depth:
+                self.content_depth += 1
+            elif any(_matches(parsed, tag, attrs) for parsed in self.content_selectors):
+                self.content_depth = 1
+
+        if self.time_index is not None:
+            if not void:
+                self.time_depth += 1
+        elif not void:
+            for index, parsed in enumerate(self.time_selectors):
+                if index not in self.time_texts and _matches(parsed, tag, attrs):
+                    self.time_index = index
+                    self.time_depth = 1
+                    self.time_parts = []
+                    break
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_ELEMENTS and self.skip_depth:
+            self.skip_depth -= 1
+        if tag in VOID_ELEMENTS:
+            return
+
+        if self.time_index is not None:
+            self.time_depth -= 1
+            if self.time_depth == 0:
+                self.time_texts[self.time_index] = ''.join(self.time_parts)
+                self.time_index = None
+
+        if self.content_depth and not self.content_done:
+            self.content_depth -= 1
+            if self.content_depth == 0:
+                self.content_done = True
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        text = data.strip()
+        if not text:
+            return
+        if self.time_index is not None:
+            self.time_parts.append(text)
+        if self.content_depth and not self.content_done:
+            self.content_parts.append(text)
+            self.content_length += len(text)
+            if self.content_length >= self.max_chars:
+                self.content_done = True
+
+
+def fetch_article_stream(session, url, content_selectors, time_selectors=(), max_chars=1500,
+                         max_bytes=512 * 1024, chunk_size=16 * 1024, timeout=10):
+    """기사를 스트리밍으로 받아 본문 앞부분과 발행시간 텍스트 추출
+
+    반환값: {'content', 'time_text', 'bytes_read', 'complete', 'parse_seconds'}
+    complete는 본문과 발행시간을 얻어 다운로드를 조기에 중단했는지 여부이고,
+    parse_seconds는 다운로드 대기를 뺀 디코딩·파싱 시간입니다.
+    """
+    extractor = StreamingArticleExtractor(content_selectors, time_selectors, max_chars)
+    bytes_read = 0
+    parse_seconds = 0.0
+
+    response = session.get(url, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        # charset이 명시되지 않으면 requests는 ISO-8859-1로 가정하므로 UTF-8을 기본으로 사용
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset' in content_type else 'utf-8'
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            bytes_read += len(chunk)
+            started = time.perf_counter()
+            extractor.feed(decoder.decode(chunk))
+            parse_seconds += time.perf_counter() - started
+            if extractor.done or bytes_read >= max_bytes:
+                break
+        else:
+            started = time.perf_counter()
+            extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+            parse_seconds += time.perf_counter() - started
+    finally:
+        response.close()
+
+    return {
+        'content': extractor.content,
+        'time_text': extractor.time_text(),
+        'bytes_read': bytes_read,
+        'complete': extractor.done,
+        'parse_seconds': parse_seconds
+    }
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+텍스트 밀도 기반 본문 추출기
+사이트별 본문 선택자가 모두 맞지 않을 때(사이트 마크업 변경 등) 사용하는 범용 추출기입니다.
+readability처럼 긴 문단이 모여 있는 요소에 점수를 주고, 링크 비율이 높은 목록·관련 기사 영역은 감점하여
+점수가 가장 높은 요소의 문단을 본문으로 사용합니다.
+"""
+
+from html_parser import LexborNode
+
+# 이보다 짧은 문단은 캡션·버튼 문구로 보고 점수에 넣지 않음
+MIN_PARAGRAPH_LENGTH = 25
+
+
+def _node_id(elem):
+    """같은 요소를 가리키는지 비교할 식별자 (selectolax는 조회할 때마다 새 래퍼를 만듦)"""
+    return elem.node.mem_id if isinstance(elem, LexborNode) else id(elem)
+
+
+def _add_score(scores, elem, score):
+    if elem is None:
+        return
+    entry = scores.setdefault(_node_id(elem), [elem, 0.0])
+    entry[1] += score
+
+
+def score_containers(soup, min_length=MIN_PARAGRAPH_LENGTH):
+    """문단(<p>)과 줄바꿈(<br>)을 담은 요소별 점수 {식별자: [요소, 점수]}"""
+    scores = {}
+    for paragraph in soup.select('p'):
+        text = paragraph.get_text(strip=True)
+        if len(text) < min_length:
+            continue
+        # 긴 문단일수록, 쉼표가 많을수록 본문일 가능성이 높음
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = paragraph.parent
+        _add_score(scores, parent, score)
+        if parent is not None:
+            _add_score(scores, parent.parent, score / 2)
+
+    # <p> 없이 <br>로 문단을 나누는 기사 본문
+    for line_break in soup.select('br'):
+        _add_score(scores, line_break.parent, 0.5)
+    return scores
+
+
+def link_density(elem, text_length):
+    """요소 텍스트 중 링크 텍스트 비율"""
+    link_length = sum(len(link.get_text(strip=True)) for link in elem.select('a'))
+    return min(1.0, link_length / max(text_length, 1))
+
+
+def extract_main_text(soup, min_length=MIN_PARAGRAPH_LENGTH):
+    """본문으로 보이는 요소의 텍스트 (찾지 못하면 빈 문자열)"""
+    best, best_score = None, 0.0
+    for elem, score in score_containers(soup, min_length).values():
+        text_length = len(elem.get_text(strip=True))
+        score *= 1 - link_density(elem, text_length)
+        if score > best_score:
+            best, best_score = elem, score
+
+    if best is None:
+        return ''
+    paragraphs = [p.get_text(strip=True) for p in best.select('p')]
+    paragraphs = [text for text in paragraphs if len(text) >= min_length]
+    if paragraphs:
+        return ' '.join(paragraphs)
+    return best.get_text(' ', strip=True)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+기사 발행시간 파서
+정규식 하나로 입력 형식(ISO, 날짜+시각, 월.일 시각, 상대 시간, 오전/오후 시각)을 판별한 뒤
+예외 없이 바로 값을 조립하여 한국 표준시(KST, +09:00) ISO 문자열로 반환합니다.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+KST = timezone(timedelta(hours=9), 'KST')
+
+RELATIVE_UNITS = {
+    '초': timedelta(seconds=1),
+    '분': timedelta(minutes=1),
+    '시간': timedelta(hours=1),
+    '일': timedelta(days=1),
+    '주': timedelta(weeks=1),
+}
+DAY_OFFSETS = {'오늘': 0, '어제': 1, '그제': 2, '그저께': 2}
+
+# 앞쪽 대안이 우선: 같은 위치에서 ISO > 날짜+시각 > 월.일 시각 > 상대 시간 > 시각만
+TIME_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)'
+    r'|(?P<year>\d{4})\s*(?:[-./]|년)\s*(?P<month>\d{1,2})\s*(?:[-./]|월)\s*(?P<day>\d{1,2})\s*(?:일|\.)?'
+    r'(?:\s*(?P<ampm>오전|오후)?\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?'
+    r'|(?<![\d.])(?P<md_month>\d{1,2})[-./](?P<md_day>\d{1,2})\s+(?P<md_hour>\d{1,2}):(?P<md_minute>\d{2})'
+    r'|(?P<amount>\d+)\s*(?P<unit>초|분|시간|일|주)\s*전'
+    r'|(?P<just>방금)'
+    r'|(?:(?P<dayword>오늘|어제|그저께|그제)\s*)?(?P<t_ampm>오전|오후)?\s*(?<![\d:])(?P<t_hour>\d{1,2}):(?P<t_minute>\d{2})(?![\d:])'
+)
+
+
+def now_kst():
+    """현재 한국 시각"""
+    return datetime.now(KST)
+
+
+def now_iso():
+    """현재 한국 시각 ISO 문자열 (발행시간을 알 수 없을 때 기본값)"""
+    return now_kst().isoformat()
+
+
+def _hour24(hour, ampm):
+    """오전/오후 표기를 24시간제로 변환"""
+    hour = int(hour)
+    if ampm == '오후' and hour < 12:
+        return hour + 12
+    if ampm == '오전' and hour == 12:
+        return 0
+    return hour
+
+
+def _from_match(match, now):
+    """정규식 일치 결과로 KST datetime 조립 (잘못된 값이면 ValueError)"""
+    iso = match.group('iso')
+    if iso:
+        parsed = datetime.fromisoformat(iso.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=KST)
+        return parsed.astimezone(KST)
+
+    groups = match.groupdict()
+    if groups['year']:
+        hour = _hour24(groups['hour'], groups['ampm']) if groups['hour'] else 0
+        return datetime(
+            int(groups['year']), int(groups['month']), int(groups['day']),
+            hour, int(groups['minute'] or 0), int(groups['second'] or 0), tzinfo=KST
+        )
+
+    if groups['md_month']:
+        # 연도가 없으면 현재 연도로 설정
+        now = now or now_kst()
+        return datetime(
+            now.year, int(groups['md_month']), int(groups['md_day']),
+            int(groups['md_hour']), int(groups['md_minute']), tzinfo=KST
+        )
+
+    now = now or now_kst()
+    if groups['amount']:
+        return now - RELATIVE_UNITS[groups['unit']] * int(groups['amount'])
+
+    if groups['just']:
+        return now
+
+    day = now.date() - timedelta(days=DAY_OFFSETS.get(groups['dayword'], 0))
+    return datetime(
+        day.year, day.month, day.day,
+        _hour24(groups['t_hour'], groups['t_ampm']), int(groups['t_minute']), tzinfo=KST
+    )
+
+
+def parse_datetime(time_str, now=None):
+    """발행시간 문자열을 KST datetime으로 변환 (인식할 수 없으면 None)"""
+    if not time_str:
+        return None
+    match = TIME_RE.search(time_str)
+    if not match:
+        return None
+    try:
+        return _from_match(match, now)
+    except ValueError:
+        return None
+
+
+def parse_time(time_str, now=None):
+    """발행시간 문자열을 KST ISO 문자열로 변환 (인식할 수 없으면 None)
+
+    지원 형식: '2024-10-18T09:30:00Z', '2024.10.18 09:30', '2024년 10월 18일 오후 2:10',
+    '10.18 09:30', '3시간 전', '방금', '오후 2:10', '어제 14:10'
+    """
+    parsed = parse_datetime(time_str, now)
+    return parsed.isoformat() if parsed else None